@@ -3,10 +3,162 @@ API integration module for fetching live market data.
 Handles cryptocurrency prices and foreign exchange rates with fallback logic.
 """
 
+import functools
+import logging
+import orjson
 import requests
+import requests_cache
+import pybreaker
 import pandas as pd
-from typing import Dict, Any
-from .config import COINGECKO_API_URL, EXCHANGERATE_API_URL, SUPPORTED_CRYPTO
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Any, Tuple
+from .config import (
+    COINGECKO_API_URL, EXCHANGERATE_API_URL, SUPPORTED_CRYPTO, API_TIMEOUT, API_RETRY_BUDGET,
+    CRYPTO_PRICES_CACHE_TTL, FX_RATES_CACHE_TTL, HTTP_CACHE_FILE,
+    API_BREAKER_FAIL_MAX, API_BREAKER_RESET_TIMEOUT
+)
+
+# Reasonable default values (as of design time) used when an API is unavailable
+FALLBACK_CRYPTO_PRICES = {
+    "bitcoin": 65000.0,
+    "ethereum": 3500.0,
+    "solana": 140.0,
+    "tether": 1.0
+}
+FALLBACK_FX_RATES = {"USD": 1.0, "EUR": 0.92, "GBP": 0.79, "CAD": 1.35}
+
+logger = logging.getLogger(__name__)
+
+# Comma-separated list of crypto IDs for the CoinGecko request (config is
+# static, so build it once)
+_CRYPTO_IDS = ",".join(SUPPORTED_CRYPTO)
+
+# Extracts the USD quote from each CoinGecko price entry
+_GET_USD = itemgetter("usd")
+
+
+class _BoundedRetry(Retry):
+    """Retry policy that never sleeps longer than backoff_max, even when the
+    server sends a long Retry-After header (CoinGecko 429s ask for ~60 s)."""
+    
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.backoff_max)
+
+
+# Transient failures (429/5xx, refused connections) are retried with
+# exponential backoff + jitter (sleeps of ~0 and 0.8 s plus up to 0.3 s
+# jitter, each capped at _RETRY_BACKOFF_MAX, Retry-After included).
+# Read timeouts are never retried (a hung API costs one read timeout, then
+# the fallback runs) and connect failures at most once. A retried attempt
+# costs at most max(API_TIMEOUT) + _RETRY_BACKOFF_MAX seconds, so the retry
+# count is derived to keep all retries within API_RETRY_BUDGET (defaults:
+# 2 retries, at most 2 x (5 + 1) = 12 s after the first attempt). A real
+# outage still surfaces quickly and trips the circuit breaker. Only GETs
+# are issued, so every retried call is idempotent.
+_RETRY_BACKOFF_MAX = 1.0
+_RETRY_POLICY = _BoundedRetry(
+    total=int(API_RETRY_BUDGET // (max(API_TIMEOUT) + _RETRY_BACKOFF_MAX)),
+    connect=1,
+    read=0,
+    backoff_factor=0.4,
+    backoff_jitter=0.3,
+    backoff_max=_RETRY_BACKOFF_MAX,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=["GET"],
+    respect_retry_after_header=True,
+)
+
+
+def _build_session() -> requests_cache.CachedSession:
+    """
+    Create an HTTP session with its own connection pool.
+    
+    The session keeps TCP+TLS connections alive between calls so repeated
+    requests to the same host skip the handshake, and serves fresh
+    responses from the on-disk cache without touching the network at all.
+    """
+    session = requests_cache.CachedSession(
+        cache_name=str(HTTP_CACHE_FILE),
+        backend="sqlite",
+    )
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=4,
+            max_retries=_RETRY_POLICY,
+        ),
+    )
+    return session
+
+
+@functools.lru_cache(maxsize=None)
+def _get_session(upstream: str) -> requests_cache.CachedSession:
+    """
+    Return the session dedicated to one upstream API, creating it on first use.
+    
+    Bulkhead: one session (and socket pool) per upstream host, so a slow or
+    hanging API cannot tie up the connections the other one needs. Sessions
+    are built lazily so importing this module does not touch the disk cache.
+    """
+    return _build_session()
+
+
+class _BreakerStateLogger(pybreaker.CircuitBreakerListener):
+    """Logs circuit breaker state transitions (closed → open → half-open)."""
+    
+    def state_change(self, cb, old_state, new_state):
+        old_name = old_state.name if old_state else "none"
+        logger.warning("🔌 Circuit breaker '%s': %s → %s", cb.name, old_name, new_state.name)
+
+
+# One breaker per upstream API. Once open, calls fail immediately (no network
+# wait) until the reset timeout elapses and a single probe call is allowed.
+_CRYPTO_BREAKER = pybreaker.CircuitBreaker(
+    fail_max=API_BREAKER_FAIL_MAX,
+    reset_timeout=API_BREAKER_RESET_TIMEOUT,
+    listeners=[_BreakerStateLogger()],
+    name="coingecko",
+)
+_FX_BREAKER = pybreaker.CircuitBreaker(
+    fail_max=API_BREAKER_FAIL_MAX,
+    reset_timeout=API_BREAKER_RESET_TIMEOUT,
+    listeners=[_BreakerStateLogger()],
+    name="exchange_rates",
+)
+
+
+@_CRYPTO_BREAKER
+def _request_crypto_prices() -> requests.Response:
+    """GET CoinGecko prices; any network or HTTP error counts as a breaker failure."""
+    response = _get_session("coingecko").get(
+        COINGECKO_API_URL,
+        params={"ids": _CRYPTO_IDS, "vs_currencies": "usd"},
+        timeout=API_TIMEOUT,
+        expire_after=CRYPTO_PRICES_CACHE_TTL
+    )
+    
+    # Raise exception if HTTP error occurred (4xx, 5xx)
+    response.raise_for_status()
+    return response
+
+
+@_FX_BREAKER
+def _request_exchange_rates() -> requests.Response:
+    """GET FX rates; any network or HTTP error counts as a breaker failure."""
+    response = _get_session("exchange_rates").get(
+        EXCHANGERATE_API_URL,
+        timeout=API_TIMEOUT,
+        expire_after=FX_RATES_CACHE_TTL
+    )
+    response.raise_for_status()
+    return response
 
 
 def fetch_crypto_prices() -> Dict[str, float]:
@@ -17,44 +169,42 @@ def fetch_crypto_prices() -> Dict[str, float]:
         Dict[str, float]: Mapping of crypto token names to USD prices
                          Example: {'bitcoin': 45000.0, 'ethereum': 2400.0}
     
+    Caching:
+        Responses are cached on disk for CRYPTO_PRICES_CACHE_TTL seconds,
+        so repeated runs within that window skip the HTTP call entirely.
+    
     Fallback Strategy:
         If the API call fails (network issues, rate limits, etc.), 
         returns hardcoded fallback prices to keep the pipeline running.
+        After repeated failures the circuit breaker opens and the fallback
+        is returned immediately, without waiting on the network.
     """
     try:
-        # Build comma-separated list of crypto IDs for API request
-        ids = ",".join(SUPPORTED_CRYPTO)
-        
-        # Make GET request to CoinGecko
-        response = requests.get(
-            COINGECKO_API_URL,
-            params={"ids": ids, "vs_currencies": "usd"}
-        )
-        
-        # Raise exception if HTTP error occurred (4xx, 5xx)
-        response.raise_for_status()
+        # Make GET request to CoinGecko (through the circuit breaker)
+        response = _request_crypto_prices()
         
-        # Parse JSON response
-        data = response.json()
+        # Parse JSON response (orjson is a faster drop-in for response.json())
+        data = orjson.loads(response.content)
         
         # Flatten nested structure: {'bitcoin': {'usd': 50000}} → {'bitcoin': 50000}
-        prices = {k: v['usd'] for k, v in data.items()}
+        prices = dict(zip(data.keys(), map(_GET_USD, data.values())))
         
-        print(f"✅ Fetched live crypto prices: {prices}")
+        if response.from_cache:
+            logger.info("⚡ Using cached crypto prices (cache hit): %s", prices)
+        else:
+            logger.info("✅ Fetched live crypto prices: %s", prices)
         return prices
         
+    except pybreaker.CircuitBreakerError:
+        # Circuit is open: skip the network call entirely
+        logger.warning("⚠️ CoinGecko circuit is open. Using fallback prices.")
+        return dict(FALLBACK_CRYPTO_PRICES)
+        
     except Exception as e:
         # Log the error but don't crash the pipeline
-        print(f"⚠️ Failed to fetch crypto prices: {e}")
-        print("Using fallback prices.")
-        
-        # Return reasonable default prices (as of design time)
-        return {
-            "bitcoin": 65000.0,
-            "ethereum": 3500.0,
-            "solana": 140.0,
-            "tether": 1.0
-        }
+        logger.warning("⚠️ Failed to fetch crypto prices: %s", e)
+        logger.warning("Using fallback prices.")
+        return dict(FALLBACK_CRYPTO_PRICES)
 
 
 def fetch_exchange_rates() -> Dict[str, float]:
@@ -67,20 +217,50 @@ def fetch_exchange_rates() -> Dict[str, float]:
                          
     How to use:
         To convert 100 EUR to USD: 100 / rates['EUR'] = ~108.70 USD
+    
+    Caching:
+        Responses are cached on disk for FX_RATES_CACHE_TTL seconds.
+    
+    Fallback Strategy:
+        Same as fetch_crypto_prices(): hardcoded rates on failure, returned
+        immediately while the circuit breaker is open.
     """
     try:
-        # Make GET request to exchange rate API
-        response = requests.get(EXCHANGERATE_API_URL)
-        response.raise_for_status()
+        # Make GET request to exchange rate API (through the circuit breaker)
+        response = _request_exchange_rates()
         
         # Parse JSON and extract rates object
-        data = response.json()
+        data = orjson.loads(response.content)
         rates = data.get("rates", {})
         
-        print(f"✅ Fetched live FX rates.")
+        if response.from_cache:
+            logger.info("⚡ Using cached FX rates (cache hit).")
+        else:
+            logger.info("✅ Fetched live FX rates.")
         return rates
         
+    except pybreaker.CircuitBreakerError:
+        logger.warning("⚠️ FX rates circuit is open. Using fallback rates.")
+        return dict(FALLBACK_FX_RATES)
+        
     except Exception as e:
         # Fallback to approximate rates if API fails
-        print(f"⚠️ Failed to fetch FX rates: {e}")
-        return {"USD": 1.0, "EUR": 0.92, "GBP": 0.79, "CAD": 1.35}
+        logger.warning("⚠️ Failed to fetch FX rates: %s", e)
+        return dict(FALLBACK_FX_RATES)
+
+
+def fetch_market_data() -> Tuple[Dict[str, float], Dict[str, float]]:
+    """
+    Fetches crypto prices and FX rates concurrently.
+    
+    Both calls are independent network round-trips, so issuing them in
+    parallel makes the wait max(RTT) instead of sum(RTT). Each fetcher
+    keeps its own fallback, so this never raises.
+    
+    Returns:
+        Tuple[Dict[str, float], Dict[str, float]]: (crypto_prices, fx_rates)
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        prices_future = executor.submit(fetch_crypto_prices)
+        rates_future = executor.submit(fetch_exchange_rates)
+        return prices_future.result(), rates_future.result()
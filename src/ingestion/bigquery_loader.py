@@ -3,12 +3,40 @@ BigQuery client and data loading utilities.
 Handles authentication, table creation, and data insertion.
 """
 
+import functools
+import io
+import logging
+import os
+from datetime import datetime
+from typing import Union
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from google.cloud import bigquery
 from google.api_core import exceptions
+from cachetools.func import ttl_cache
+
+# The Storage Read API client ships as an optional extra; without it every
+# read falls back to the regular REST query path
+try:
+    from google.cloud import bigquery_storage
+    from google.cloud.bigquery_storage import types as bq_storage_types
+except ImportError:
+    bigquery_storage = None
 import pandas as pd
-from .config import GCP_PROJECT_ID, BQ_DATASET, BQ_TABLE, BQ_TABLE_FULL
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from .config import (
+    GCP_PROJECT_ID, BQ_DATASET, BQ_TABLE, BQ_TABLE_FULL, BQ_USERS_TABLE,
+    BQ_DEPOSITS_TABLE, BQ_WITHDRAWALS_TABLE, BQ_TRADES_TABLE, BQ_ORDERS_TABLE,
+    USER_IDS_CACHE_TTL, BQ_USE_STORAGE_API, LAST_DATE_LOOKBACK_DAYS,
+    LOAD_CHUNK_ROWS, LOAD_MAX_PARALLEL_JOBS, USER_IDS_CACHE_FILE
+)
+from .schemas import SCHEMAS, PARTITION_FIELDS, CLUSTERING_FIELDS
+
+logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
 def get_bigquery_client():
     """
     Initialize and return authenticated BigQuery client.
@@ -16,12 +44,95 @@ def get_bigquery_client():
     Authentication is handled via GOOGLE_APPLICATION_CREDENTIALS env var,
     which should point to your service account JSON key file.
     
+    The client is created once per process and reused, so credentials,
+    auth tokens and the HTTP connection pool are shared by every caller.
+    Call get_bigquery_client.cache_clear() after switching credentials
+    (e.g. in tests) to force a fresh client.
+    
     Returns:
         bigquery.Client: Authenticated BigQuery client instance
     """
     return bigquery.Client(project=GCP_PROJECT_ID)
 
 
+# Full names of tables already known to exist in this process, so repeated
+# create_*_if_not_exists calls skip the create_table round-trip
+_EXISTING_TABLES = set()
+
+
+def _create_table(client, table_id: str, dataset: str = BQ_DATASET):
+    """
+    Issue a create_table call for one registered table.
+    
+    Applies the table's day-partitioning and clustering from schemas.py.
+    These only take effect for newly created tables; existing tables keep
+    their layout.
+    
+    Args:
+        client: Authenticated BigQuery client
+        table_id: Table name (key of SCHEMAS)
+        dataset: BigQuery dataset name
+    """
+    table_name = f"{GCP_PROJECT_ID}.{dataset}.{table_id}"
+    table = bigquery.Table(table_name, schema=SCHEMAS[table_id])
+    
+    if table_id in PARTITION_FIELDS:
+        table.time_partitioning = bigquery.TimePartitioning(
+            type_=bigquery.TimePartitioningType.DAY,
+            field=PARTITION_FIELDS[table_id],
+        )
+    if table_id in CLUSTERING_FIELDS:
+        table.clustering_fields = CLUSTERING_FIELDS[table_id]
+    
+    try:
+        client.create_table(table)
+        logger.info("✅ Created table %s", table_name)
+    except exceptions.Conflict:
+        # Table already exists - this is fine, we want idempotent operations
+        logger.info("ℹ️  Table %s already exists", table_name)
+    
+    _EXISTING_TABLES.add(table_name)
+
+
+def _ensure_table(client, table_id: str, dataset: str = BQ_DATASET):
+    """Create one table unless it is already known to exist."""
+    if f"{GCP_PROJECT_ID}.{dataset}.{table_id}" in _EXISTING_TABLES:
+        return
+    _create_table(client, table_id, dataset)
+
+
+def ensure_all_tables(client, dataset: str = BQ_DATASET):
+    """
+    Create every missing raw table with a single metadata lookup.
+    
+    Lists the dataset once, then creates only the missing tables in
+    parallel, instead of one serial create_table call per table.
+    On a warm dataset this is just the list call.
+    
+    Args:
+        client: Authenticated BigQuery client
+        dataset: BigQuery dataset name
+    
+    Returns:
+        list: Names of the tables that were missing
+    """
+    existing = {t.table_id for t in client.list_tables(f"{GCP_PROJECT_ID}.{dataset}")}
+    for table_id in existing:
+        _EXISTING_TABLES.add(f"{GCP_PROJECT_ID}.{dataset}.{table_id}")
+    
+    missing = [table_id for table_id in SCHEMAS if table_id not in existing]
+    if not missing:
+        logger.info("ℹ️  All %d tables already exist in %s", len(SCHEMAS), dataset)
+        return []
+    
+    with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+        futures = [executor.submit(_create_table, client, table_id, dataset) for table_id in missing]
+        for future in futures:
+            future.result()
+    
+    return missing
+
+
 def create_table_if_not_exists(client):
     """
     Create the ramp_transactions table in BigQuery if it doesn't exist.
@@ -44,68 +155,78 @@ def create_table_if_not_exists(client):
     Args:
         client: Authenticated BigQuery client
     """
-    # Define the table schema with column names, types, and descriptions
-    schema = [
-        bigquery.SchemaField("transaction_id", "STRING", mode="REQUIRED", description="Unique transaction identifier"),
-        bigquery.SchemaField("user_id", "STRING", mode="REQUIRED", description="User identifier"),
-        bigquery.SchemaField("timestamp", "TIMESTAMP", mode="REQUIRED", description="Transaction timestamp"),
-        bigquery.SchemaField("fiat_currency", "STRING", mode="REQUIRED", description="Fiat currency code (USD, EUR, etc.)"),
-        bigquery.SchemaField("fiat_amount", "FLOAT64", mode="REQUIRED", description="Amount in fiat currency"),
-        bigquery.SchemaField("crypto_token", "STRING", mode="REQUIRED", description="Cryptocurrency purchased"),
-        bigquery.SchemaField("crypto_amount", "FLOAT64", mode="REQUIRED", description="Amount of crypto received"),
-        bigquery.SchemaField("payment_method", "STRING", mode="REQUIRED", description="Payment method used"),
-        bigquery.SchemaField("country", "STRING", mode="REQUIRED", description="User country code"),
-        bigquery.SchemaField("status", "STRING", mode="REQUIRED", description="Transaction status"),
-        bigquery.SchemaField("fee_usd", "FLOAT64", mode="REQUIRED", description="Transaction fee in USD"),
-    ]
-    
-    # Create table reference object
-    table = bigquery.Table(BQ_TABLE_FULL, schema=schema)
-    
-    try:
-        # Attempt to create table (does nothing if already exists)
-        table = client.create_table(table)
-        print(f"✅ Created table {BQ_TABLE_FULL}")
-    except exceptions.Conflict:
-        # Table already exists - this is fine, we want idempotent operations
-        print(f"ℹ️  Table {BQ_TABLE_FULL} already exists")
+    _ensure_table(client, BQ_TABLE)
+
+
+def _is_day_partitioned(client, table_name: str) -> bool:
+    """Whether an existing table is day-partitioned (so table$YYYYMMDD decorators work)."""
+    partitioning = client.get_table(table_name).time_partitioning
+    return partitioning is not None and partitioning.type_ == bigquery.TimePartitioningType.DAY
 
 
-def load_dataframe_to_bigquery(client, df: pd.DataFrame):
+def load_dataframe_to_bigquery(client, df: pd.DataFrame, partition_date=None):
     """
-    Load a pandas DataFrame into BigQuery table.
+    Load a pandas DataFrame into the ramp_transactions table.
     
-    Uses streaming insert which is immediate but has quota limits.
-    For production, consider using load jobs instead.
+    Uses a batch load job with Parquet serialization (via pyarrow), which
+    keeps column types intact and uploads far fewer bytes than CSV.
+    
+    With partition_date, the rows replace that day's partition
+    (WRITE_TRUNCATE on the table$YYYYMMDD decorator) instead of being
+    appended, so re-running a day after a failure never duplicates rows.
+    Every row must then fall on that day (UTC). The partition is written by
+    one load job: chunked parallel jobs would each truncate it.
+    Tables created before day partitioning was added stay unpartitioned
+    (existing layouts are never altered); for those the rows are appended
+    as before.
     
     Args:
         client: Authenticated BigQuery client
         df: Pandas DataFrame with transaction data
+        partition_date: Optional date whose partition the rows overwrite
     
     Returns:
         int: Number of rows successfully loaded
     """
-    # Configure the load job
-    job_config = bigquery.LoadJobConfig(
-        # WRITE_APPEND adds new rows without deleting existing data
-        write_disposition="WRITE_APPEND",
-        
-        # Automatically detect schema from DataFrame
-        # (should match our defined schema)
-        autodetect=False,
-    )
+    if partition_date is None or not _is_day_partitioned(client, BQ_TABLE_FULL):
+        if partition_date is not None:
+            logger.info("ℹ️  %s is not day-partitioned; appending instead of overwriting %s",
+                        BQ_TABLE_FULL, partition_date)
+        return load_dataframe_to_table(client, df, BQ_TABLE_FULL)
+    
+    job_config = _parquet_load_job_config(BQ_TABLE_FULL)
+    job_config.write_disposition = "WRITE_TRUNCATE"
+    partition = f"{BQ_TABLE_FULL}${partition_date:%Y%m%d}"
+    return _run_load_job(client, df, partition, job_config)
+
+
+def _query_last_partition_date(client):
+    """
+    Look up the newest non-empty day partition of the transactions table.
     
-    # Start the load job (asynchronous operation)
-    job = client.load_table_from_dataframe(
-        df, 
-        BQ_TABLE_FULL, 
-        job_config=job_config
-    )
+    Reads INFORMATION_SCHEMA.PARTITIONS, a metadata view, so no table data
+    is scanned or billed. Only real day partitions (YYYYMMDD IDs) count;
+    special IDs like __NULL__ or __STREAMING_UNPARTITIONED__ sort above
+    every date and would otherwise win the MAX().
     
-    # Wait for job to complete (synchronous)
-    job.result()
+    Returns:
+        str: ISO date of the newest partition, or None if there is none
+    """
+    query = f"""
+        SELECT MAX(partition_id) as last_partition
+        FROM `{GCP_PROJECT_ID}.{BQ_DATASET}.INFORMATION_SCHEMA.PARTITIONS`
+        WHERE table_name = '{BQ_TABLE}'
+          AND REGEXP_CONTAINS(partition_id, r'^\\d{{8}}$')
+          AND total_rows > 0
+    """
+    results = client.query(query).result().to_arrow(bqstorage_client=get_bqstorage_client())
     
-    return len(df)
+    last_partition = results.column("last_partition")[0].as_py() if results.num_rows else None
+    if not last_partition:
+        return None
+    
+    # Partition IDs are YYYYMMDD → YYYY-MM-DD
+    return datetime.strptime(last_partition, "%Y%m%d").date().isoformat()
 
 
 def query_last_transaction_date(client):
@@ -114,26 +235,46 @@ def query_last_transaction_date(client):
     
     This is used to determine what date to generate next batch for.
     
+    The newest day partition is read from INFORMATION_SCHEMA first, which
+    costs nothing. If that is unavailable (e.g. an older, unpartitioned
+    table or missing metadata permissions), the table itself is queried:
+    first the last LAST_DATE_LOOKBACK_DAYS days (pruned to those
+    partitions), and the full table only if that window is empty.
+    
     Args:
         client: Authenticated BigQuery client
     
     Returns:
         str: ISO format date (YYYY-MM-DD) of last transaction, or None if table is empty
     """
-    query = f"""
-        SELECT MAX(DATE(timestamp)) as last_date
+    try:
+        last_date = _query_last_partition_date(client)
+        if last_date:
+            return last_date
+    except (exceptions.GoogleAPIError, ValueError) as e:
+        # ValueError: a partition ID that is not a YYYYMMDD date
+        logger.info("ℹ️  Partition metadata lookup failed, querying table instead: %s", e)
+    
+    recent_query = f"""
+        SELECT DATE(MAX(timestamp)) as last_date
+        FROM `{BQ_TABLE_FULL}`
+        WHERE timestamp > TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL {LAST_DATE_LOOKBACK_DAYS} DAY)
+    """
+    full_query = f"""
+        SELECT DATE(MAX(timestamp)) as last_date
         FROM `{BQ_TABLE_FULL}`
     """
     
     try:
-        # Execute query and fetch results
-        query_job = client.query(query)
-        results = query_job.result()
-        
-        # Extract the single row result
-        for row in results:
-            if row.last_date:
-                return row.last_date.isoformat()
+        for query in (recent_query, full_query):
+            # Execute query and fetch results as Arrow (no per-row Python objects)
+            query_job = client.query(query)
+            results = query_job.result().to_arrow(bqstorage_client=get_bqstorage_client())
+            
+            # Extract the single row result
+            last_date = results.column("last_date")[0].as_py() if results.num_rows else None
+            if last_date:
+                return last_date.isoformat()
         
         # Table exists but is empty
         return None
@@ -162,54 +303,136 @@ def create_users_table_if_not_exists(client, dataset: str = BQ_DATASET):
         client: Authenticated BigQuery client
         dataset: BigQuery dataset name
     """
-    table_name = f"{GCP_PROJECT_ID}.{dataset}.users"
+    _ensure_table(client, BQ_USERS_TABLE, dataset)
+
+
+def _parquet_load_job_config(table_name: str) -> bigquery.LoadJobConfig:
+    """
+    Build an append-only Parquet load job config for a table.
     
-    schema = [
-        bigquery.SchemaField("user_id", "STRING", mode="REQUIRED", description="Unique user identifier"),
-        bigquery.SchemaField("email", "STRING", mode="REQUIRED", description="User email address"),
-        bigquery.SchemaField("signup_date", "TIMESTAMP", mode="REQUIRED", description="Account creation date"),
-        bigquery.SchemaField("country", "STRING", mode="REQUIRED", description="User country code"),
-        bigquery.SchemaField("kyc_status", "STRING", mode="REQUIRED", description="KYC verification status"),
-        bigquery.SchemaField("account_tier", "STRING", mode="REQUIRED", description="Account tier level"),
-        bigquery.SchemaField("account_balance_usd", "FLOAT64", mode="REQUIRED", description="Current balance in USD"),
-        bigquery.SchemaField("is_active", "BOOLEAN", mode="REQUIRED", description="Account active status"),
-        bigquery.SchemaField("created_at", "TIMESTAMP", mode="REQUIRED", description="Record creation timestamp"),
-    ]
+    When the table is registered in SCHEMAS the schema is attached,
+    so BigQuery uses it directly instead of deriving one from the data.
+    """
+    # WRITE_APPEND adds new rows without deleting existing data
+    job_config = bigquery.LoadJobConfig(
+        write_disposition="WRITE_APPEND",
+        source_format=bigquery.SourceFormat.PARQUET,
+    )
     
-    table = bigquery.Table(table_name, schema=schema)
+    schema = SCHEMAS.get(table_name.rsplit(".", 1)[-1])
+    if schema is not None:
+        job_config.schema = schema
     
-    try:
-        table = client.create_table(table)
-        print(f"✅ Created table {table_name}")
-    except exceptions.Conflict:
-        print(f"ℹ️  Table {table_name} already exists")
+    return job_config
+
+
+# Arrow type written to Parquet for each BigQuery column type. TIMESTAMP must
+# be UTC-adjusted: naive Parquet timestamps are read by BigQuery as DATETIME.
+_BQ_TO_ARROW_TYPES = {
+    "STRING": pa.string(),
+    "FLOAT64": pa.float64(),
+    "INT64": pa.int64(),
+    "BOOLEAN": pa.bool_(),
+    "TIMESTAMP": pa.timestamp("us", tz="UTC"),
+}
+
 
+def _arrow_schema(bq_schema) -> pa.Schema:
+    """Translate a BigQuery schema (SchemaField tuple) to the Arrow schema of its Parquet load files."""
+    return pa.schema([
+        pa.field(field.name, _BQ_TO_ARROW_TYPES[field.field_type], nullable=field.mode != "REQUIRED")
+        for field in bq_schema
+    ])
 
-def load_dataframe_to_table(client, df: pd.DataFrame, table_name: str):
+
+def _dataframe_to_parquet_buffer(df: Union[pd.DataFrame, pa.Table], bq_schema) -> io.BytesIO:
+    """
+    Serialize a DataFrame (or Arrow table) to an in-memory Parquet file for a load job.
+    
+    Columns are selected in bq_schema order and cast to its Arrow
+    equivalent: categoricals become plain strings, timestamps become
+    UTC-adjusted microseconds (BigQuery's TIMESTAMP precision; naive ones
+    are interpreted as UTC) and REQUIRED fields are written non-null.
+    """
+    table = df if isinstance(df, pa.Table) else pa.Table.from_pandas(df, preserve_index=False)
+    target = _arrow_schema(bq_schema)
+    
+    columns = []
+    for field in target:
+        column = table.column(field.name)
+        if pa.types.is_timestamp(field.type) and column.type.tz is None:
+            # Naive timestamps are UTC wall-clock values; tag them before converting units
+            column = pc.assume_timezone(column, "UTC")
+        # Sub-microsecond precision is dropped (unsafe cast only for timestamps)
+        columns.append(column.cast(field.type, safe=not pa.types.is_timestamp(field.type)))
+    table = pa.Table.from_arrays(columns, schema=target)
+    
+    buffer = io.BytesIO()
+    pq.write_table(table, buffer, compression="snappy")
+    buffer.seek(0)
+    return buffer
+
+
+def _run_load_job(client, df: Union[pd.DataFrame, pa.Table], table_name: str, job_config) -> int:
+    """Submit one load job and block until it finishes."""
+    # Tables without a registered schema keep the library's own
+    # schema-aware DataFrame conversion
+    if job_config.schema is None:
+        if isinstance(df, pa.Table):
+            df = df.to_pandas()
+        job = client.load_table_from_dataframe(df, table_name, job_config=job_config)
+    else:
+        # Serialize straight to an in-memory Parquet buffer (no temp file on
+        # disk) and start the load job (asynchronous operation)
+        job = client.load_table_from_file(
+            _dataframe_to_parquet_buffer(df, job_config.schema), 
+            table_name, 
+            job_config=job_config
+        )
+    
+    # Wait for job to complete (synchronous)
+    job.result()
+    return len(df)
+
+
+def load_dataframe_to_table(client, df: Union[pd.DataFrame, pa.Table], table_name: str):
     """
-    Load a pandas DataFrame into any BigQuery table.
+    Load a pandas DataFrame (or pyarrow.Table) into any BigQuery table.
+    
+    The DataFrame is serialized to Parquet with pyarrow before upload.
+    DataFrames larger than LOAD_CHUNK_ROWS are split into chunks that are
+    uploaded as parallel load jobs (all WRITE_APPEND to the same table),
+    so serialization and upload bandwidth are not bottlenecked on one job.
     
     Args:
         client: Authenticated BigQuery client
-        df: Pandas DataFrame to load
+        df: Pandas DataFrame or Arrow table to load
         table_name: Full table name (project.dataset.table)
     
     Returns:
         int: Number of rows successfully loaded
     """
-    job_config = bigquery.LoadJobConfig(
-        write_disposition="WRITE_APPEND",
-        autodetect=False,
-    )
-    
-    job = client.load_table_from_dataframe(
-        df, 
-        table_name, 
-        job_config=job_config
-    )
-    
-    job.result()
-    return len(df)
+    job_config = _parquet_load_job_config(table_name)
+    
+    if len(df) <= LOAD_CHUNK_ROWS:
+        return _run_load_job(client, df, table_name, job_config)
+    
+    if isinstance(df, pa.Table):
+        chunks = [df.slice(start, LOAD_CHUNK_ROWS) for start in range(0, len(df), LOAD_CHUNK_ROWS)]
+    else:
+        chunks = [df.iloc[start:start + LOAD_CHUNK_ROWS] for start in range(0, len(df), LOAD_CHUNK_ROWS)]
+    logger.info("📦 Loading %d rows to %s as %d parallel load jobs", len(df), table_name, len(chunks))
+    
+    rows_loaded = 0
+    with ThreadPoolExecutor(max_workers=min(len(chunks), LOAD_MAX_PARALLEL_JOBS)) as executor:
+        futures = [
+            executor.submit(_run_load_job, client, chunk, table_name, job_config)
+            for chunk in chunks
+        ]
+        for future in as_completed(futures):
+            rows_loaded += future.result()
+    
+    return rows_loaded
 
 
 def create_deposits_table_if_not_exists(client, dataset: str = BQ_DATASET):
@@ -232,116 +455,163 @@ def create_deposits_table_if_not_exists(client, dataset: str = BQ_DATASET):
         client: Authenticated BigQuery client
         dataset: BigQuery dataset name
     """
-    table_name = f"{GCP_PROJECT_ID}.{dataset}.deposits"
-    
-    schema = [
-        bigquery.SchemaField("deposit_id", "STRING", mode="REQUIRED", description="Unique deposit identifier"),
-        bigquery.SchemaField("user_id", "STRING", mode="REQUIRED", description="User identifier"),
-        bigquery.SchemaField("timestamp", "TIMESTAMP", mode="REQUIRED", description="Deposit initiation time"),
-        bigquery.SchemaField("deposit_type", "STRING", mode="REQUIRED", description="Type of deposit (fiat or crypto)"),
-        bigquery.SchemaField("currency", "STRING", mode="REQUIRED", description="Currency code"),
-        bigquery.SchemaField("amount", "FLOAT64", mode="REQUIRED", description="Deposit amount"),
-        bigquery.SchemaField("payment_method", "STRING", mode="REQUIRED", description="Payment method used"),
-        bigquery.SchemaField("status", "STRING", mode="REQUIRED", description="Deposit status"),
-        bigquery.SchemaField("blockchain_confirmations", "INT64", mode="NULLABLE", description="Blockchain confirmations (crypto only)"),
-        bigquery.SchemaField("created_at", "TIMESTAMP", mode="REQUIRED", description="Record creation timestamp"),
-    ]
-    
-    table = bigquery.Table(table_name, schema=schema)
-    
-    try:
-        table = client.create_table(table)
-        print(f"✅ Created table {table_name}")
-    except exceptions.Conflict:
-        print(f"ℹ️  Table {table_name} already exists")
+    _ensure_table(client, BQ_DEPOSITS_TABLE, dataset)
 
 
 def create_withdrawals_table_if_not_exists(client, dataset: str = BQ_DATASET):
     """Create the withdrawals table in BigQuery if it doesn't exist."""
-    table_name = f"{GCP_PROJECT_ID}.{dataset}.withdrawals"
-    
-    schema = [
-        bigquery.SchemaField("withdrawal_id", "STRING", mode="REQUIRED", description="Unique withdrawal identifier"),
-        bigquery.SchemaField("user_id", "STRING", mode="REQUIRED", description="User identifier"),
-        bigquery.SchemaField("timestamp", "TIMESTAMP", mode="REQUIRED", description="Withdrawal initiation time"),
-        bigquery.SchemaField("withdrawal_type", "STRING", mode="REQUIRED", description="Type of withdrawal (fiat or crypto)"),
-        bigquery.SchemaField("currency", "STRING", mode="REQUIRED", description="Currency code"),
-        bigquery.SchemaField("amount", "FLOAT64", mode="REQUIRED", description="Withdrawal amount"),
-        bigquery.SchemaField("fee", "FLOAT64", mode="REQUIRED", description="Withdrawal fee"),
-        bigquery.SchemaField("destination_type", "STRING", mode="REQUIRED", description="Destination type"),
-        bigquery.SchemaField("tx_hash", "STRING", mode="NULLABLE", description="Blockchain transaction hash"),
-        bigquery.SchemaField("status", "STRING", mode="REQUIRED", description="Withdrawal status"),
-        bigquery.SchemaField("created_at", "TIMESTAMP", mode="REQUIRED", description="Record creation timestamp"),
-    ]
-    
-    table = bigquery.Table(table_name, schema=schema)
-    
-    try:
-        table = client.create_table(table)
-        print(f"✅ Created table {table_name}")
-    except exceptions.Conflict:
-        print(f"ℹ️  Table {table_name} already exists")
+    _ensure_table(client, BQ_WITHDRAWALS_TABLE, dataset)
 
 
 def create_trades_table_if_not_exists(client, dataset: str = BQ_DATASET):
     """Create the trades table in BigQuery if it doesn't exist."""
-    table_name = f"{GCP_PROJECT_ID}.{dataset}.trades"
-    
-    schema = [
-        bigquery.SchemaField("trade_id", "STRING", mode="REQUIRED", description="Unique trade identifier"),
-        bigquery.SchemaField("order_id", "STRING", mode="REQUIRED", description="Order that generated this trade"),
-        bigquery.SchemaField("user_id", "STRING", mode="REQUIRED", description="User identifier"),
-        bigquery.SchemaField("timestamp", "TIMESTAMP", mode="REQUIRED", description="Trade execution time"),
-        bigquery.SchemaField("trading_pair", "STRING", mode="REQUIRED", description="Trading pair (e.g. BTC/USD)"),
-        bigquery.SchemaField("side", "STRING", mode="REQUIRED", description="Trade side (buy or sell)"),
-        bigquery.SchemaField("base_currency", "STRING", mode="REQUIRED", description="Base currency"),
-        bigquery.SchemaField("quote_currency", "STRING", mode="REQUIRED", description="Quote currency"),
-        bigquery.SchemaField("base_amount", "FLOAT64", mode="REQUIRED", description="Amount in base currency"),
-        bigquery.SchemaField("quote_amount", "FLOAT64", mode="REQUIRED", description="Amount in quote currency"),
-        bigquery.SchemaField("price", "FLOAT64", mode="REQUIRED", description="Execution price"),
-        bigquery.SchemaField("fee_amount", "FLOAT64", mode="REQUIRED", description="Trading fee amount"),
-        bigquery.SchemaField("fee_currency", "STRING", mode="REQUIRED", description="Fee currency"),
-        bigquery.SchemaField("order_type", "STRING", mode="REQUIRED", description="Order type (market or limit)"),
-        bigquery.SchemaField("is_maker", "BOOLEAN", mode="REQUIRED", description="Whether this was a maker order"),
-        bigquery.SchemaField("created_at", "TIMESTAMP", mode="REQUIRED", description="Record creation timestamp"),
-    ]
-    
-    table = bigquery.Table(table_name, schema=schema)
-    
-    try:
-        table = client.create_table(table)
-        print(f"✅ Created table {table_name}")
-    except exceptions.Conflict:
-        print(f"ℹ️  Table {table_name} already exists")
+    _ensure_table(client, BQ_TRADES_TABLE, dataset)
 
 
 def create_orders_table_if_not_exists(client, dataset: str = BQ_DATASET):
     """Create the orders table in BigQuery if it doesn't exist."""
-    table_name = f"{GCP_PROJECT_ID}.{dataset}.orders"
-    
-    schema = [
-        bigquery.SchemaField("order_id", "STRING", mode="REQUIRED", description="Unique order identifier"),
-        bigquery.SchemaField("user_id", "STRING", mode="REQUIRED", description="User identifier"),
-        bigquery.SchemaField("timestamp", "TIMESTAMP", mode="REQUIRED", description="Order placement time"),
-        bigquery.SchemaField("trading_pair", "STRING", mode="REQUIRED", description="Trading pair (e.g. BTC/USD)"),
-        bigquery.SchemaField("side", "STRING", mode="REQUIRED", description="Order side (buy or sell)"),
-        bigquery.SchemaField("order_type", "STRING", mode="REQUIRED", description="Order type (market or limit)"),
-        bigquery.SchemaField("base_currency", "STRING", mode="REQUIRED", description="Base currency"),
-        bigquery.SchemaField("quote_currency", "STRING", mode="REQUIRED", description="Quote currency"),
-        bigquery.SchemaField("base_amount", "FLOAT64", mode="REQUIRED", description="Total order amount"),
-        bigquery.SchemaField("filled_amount", "FLOAT64", mode="REQUIRED", description="Amount filled"),
-        bigquery.SchemaField("limit_price", "FLOAT64", mode="NULLABLE", description="Limit price (for limit orders)"),
-        bigquery.SchemaField("status", "STRING", mode="REQUIRED", description="Order status"),
-        bigquery.SchemaField("created_at", "TIMESTAMP", mode="REQUIRED", description="Record creation timestamp"),
-    ]
-    
-    table = bigquery.Table(table_name, schema=schema)
+    _ensure_table(client, BQ_ORDERS_TABLE, dataset)
+
+
+@functools.lru_cache(maxsize=1)
+def get_bqstorage_client():
+    """
+    Initialize and return a BigQuery Storage Read API client.
     
+    Uses the same GOOGLE_APPLICATION_CREDENTIALS as the regular client and
+    is created once per process.
+    
+    Returns:
+        bigquery_storage.BigQueryReadClient: Authenticated Storage API client,
+        or None when the Storage API is disabled (BQ_USE_STORAGE_API=0) or
+        google-cloud-bigquery-storage is not installed
+    """
+    if not BQ_USE_STORAGE_API or bigquery_storage is None:
+        return None
+    return bigquery_storage.BigQueryReadClient()
+
+
+def _query_active_user_ids(client, dataset: str, limit: int) -> tuple:
+    """
+    Read the user_id column of active users.
+    
+    With the Storage Read API, column projection and the is_active filter
+    are pushed down to storage, so no query job (planning, temp table,
+    REST pagination) is involved. Without it, a regular query is run and
+    its result is pulled as Arrow rather than iterated row by row.
+    """
+    read_client = get_bqstorage_client()
+    
+    if read_client is None:
+        query = f"""
+            SELECT user_id 
+            FROM `{GCP_PROJECT_ID}.{dataset}.{BQ_USERS_TABLE}`
+            WHERE is_active = TRUE
+            LIMIT {limit}
+        """
+        arrow_table = client.query(query).result().to_arrow()
+        return tuple(arrow_table.column("user_id").to_pylist())
+    
+    requested_session = bq_storage_types.ReadSession(
+        table=f"projects/{GCP_PROJECT_ID}/datasets/{dataset}/tables/{BQ_USERS_TABLE}",
+        data_format=bq_storage_types.DataFormat.ARROW,
+        read_options=bq_storage_types.ReadSession.TableReadOptions(
+            selected_fields=["user_id"],
+            row_restriction="is_active = TRUE",
+        ),
+    )
+    
+    # A single stream is plenty for a few thousand ids
+    session = read_client.create_read_session(
+        parent=f"projects/{GCP_PROJECT_ID}",
+        read_session=requested_session,
+        max_stream_count=1,
+    )
+    
+    user_ids = []
+    for stream in session.streams:
+        if len(user_ids) >= limit:
+            break
+        arrow_table = read_client.read_rows(stream.name).to_arrow(session)
+        user_ids.extend(arrow_table.column("user_id").to_pylist())
+    
+    return tuple(user_ids[:limit])
+
+
+def _user_ids_cache_key(users_table, dataset: str, limit: int) -> bytes:
+    """
+    Key stored with the user_ids sidecar; any change makes the file stale.
+    
+    Includes the users table's last-modified time as well as its row
+    count, so a reload or recreate with the same number of users, or an
+    is_active update, still invalidates the file.
+    """
+    modified = users_table.modified.isoformat() if users_table.modified else ""
+    return f"{dataset}:{limit}:{users_table.num_rows}:{modified}".encode()
+
+
+def _read_user_ids_sidecar(cache_key: bytes):
+    """Return the user_ids from USER_IDS_CACHE_FILE if it matches cache_key, else None."""
+    if not USER_IDS_CACHE_FILE.exists():
+        return None
     try:
-        table = client.create_table(table)
-        print(f"✅ Created table {table_name}")
-    except exceptions.Conflict:
-        print(f"ℹ️  Table {table_name} already exists")
+        table = pq.read_table(USER_IDS_CACHE_FILE)
+    except (OSError, pa.ArrowInvalid):
+        return None
+    if (table.schema.metadata or {}).get(b"cache_key") != cache_key:
+        return None
+    return tuple(table.column("user_id").to_pylist())
+
+
+def _write_user_ids_sidecar(user_ids: tuple, cache_key: bytes):
+    """Persist user_ids to USER_IDS_CACHE_FILE, tagged with cache_key."""
+    table = pa.table({"user_id": pa.array(user_ids, type=pa.string())})
+    table = table.replace_schema_metadata({"cache_key": cache_key})
+    USER_IDS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    
+    # Write to a temp file next to it, then swap it in, so a crash mid-write
+    # never leaves a truncated sidecar behind
+    tmp_file = USER_IDS_CACHE_FILE.with_suffix(".tmp")
+    pq.write_table(table, tmp_file)
+    os.replace(tmp_file, USER_IDS_CACHE_FILE)
+
+
+@ttl_cache(maxsize=4, ttl=USER_IDS_CACHE_TTL)
+def _read_active_user_ids(client, dataset: str, limit: int) -> tuple:
+    """
+    Return the active user_ids, from the local sidecar file when it is current.
+    
+    The users table's row count and last-modified time come from a free
+    metadata call (get_table). When they match the values stored in
+    USER_IDS_CACHE_FILE, the ids are read from that file. Otherwise the
+    table is read and the file rewritten. Any load, DML statement or
+    recreate of the table changes its modified time, so an unchanged key
+    means an unchanged set of ids.
+    Results are also memoized in-process per (dataset, limit) for
+    USER_IDS_CACHE_TTL seconds; errors are not cached.
+    """
+    users_table = client.get_table(f"{GCP_PROJECT_ID}.{dataset}.{BQ_USERS_TABLE}")
+    cache_key = _user_ids_cache_key(users_table, dataset, limit)
+    
+    user_ids = _read_user_ids_sidecar(cache_key)
+    if user_ids is not None:
+        logger.debug("📂 Using cached user_ids from %s", USER_IDS_CACHE_FILE)
+        return user_ids
+    
+    user_ids = _query_active_user_ids(client, dataset, limit)
+    if user_ids:
+        _write_user_ids_sidecar(user_ids, cache_key)
+    return user_ids
+
+
+def clear_user_ids_cache():
+    """
+    Drop cached user_ids so the next lookup reads the users table again.
+    
+    Call this after loading new users. (The on-disk copy goes stale by
+    itself, since loading changes the users table modified time.)
+    """
+    _read_active_user_ids.cache_clear()
 
 
 def get_user_ids_from_bigquery(client, dataset: str = BQ_DATASET, limit: int = 10000):
@@ -349,6 +619,12 @@ def get_user_ids_from_bigquery(client, dataset: str = BQ_DATASET, limit: int = 1
     Fetches real user_ids from the users table in BigQuery.
     This ensures referential integrity across all tables.
     
+    Reads through the BigQuery Storage Read API (Arrow over gRPC) instead
+    of running a query job, when available. Results are cached in-process for
+    USER_IDS_CACHE_TTL seconds, so the loaders that run one after another
+    share a single read, and on disk (USER_IDS_CACHE_FILE) until the users
+    table changes.
+    
     Args:
         client: BigQuery client
         dataset: BigQuery dataset name
@@ -357,22 +633,11 @@ def get_user_ids_from_bigquery(client, dataset: str = BQ_DATASET, limit: int = 1
     Returns:
         list: List of user_id strings
     """
-    table_name = f"{GCP_PROJECT_ID}.{dataset}.users"
-    
-    query = f"""
-        SELECT user_id 
-        FROM `{table_name}`
-        WHERE is_active = TRUE
-        LIMIT {limit}
-    """
-    
     try:
-        query_job = client.query(query)
-        results = query_job.result()
-        user_ids = [row.user_id for row in results]
-        print(f"✅ Fetched {len(user_ids)} real user_ids from BigQuery")
+        user_ids = list(_read_active_user_ids(client, dataset, limit))
+        logger.info("✅ Fetched %d real user_ids from BigQuery", len(user_ids))
         return user_ids
     except Exception as e:
-        print(f"⚠️  Could not fetch user_ids from BigQuery: {e}")
-        print(f"💡 Make sure to run load_users_table() first!")
+        logger.warning("⚠️  Could not fetch user_ids from BigQuery: %s", e)
+        logger.warning("💡 Make sure to run load_users_table() first!")
         return []
@@ -5,6 +5,7 @@ Defines paths, API endpoints, and business logic constants.
 
 import os
 from pathlib import Path
+import numpy as np
 
 # ============================================================================
 # DIRECTORY STRUCTURE
@@ -17,8 +18,9 @@ BASE_DIR = Path(__file__).resolve().parents[2]
 DATA_DIR = BASE_DIR / "data"
 RAW_DATA_DIR = DATA_DIR / "raw"
 
-# Ensure the raw data directory exists (creates it if missing)
-RAW_DATA_DIR.mkdir(parents=True, exist_ok=True)
+# Write local CSV backups of loaded tables to RAW_DATA_DIR (in a background
+# thread). Off by default: BigQuery is the system of record.
+WRITE_CSV_BACKUP = os.getenv("WRITE_CSV_BACKUP", "0") == "1"
 
 # ============================================================================
 # EXTERNAL API ENDPOINTS
@@ -30,6 +32,23 @@ COINGECKO_API_URL = "https://api.coingecko.com/api/v3/simple/price"
 # Open Exchange Rates API: Free tier for fiat currency conversion rates
 EXCHANGERATE_API_URL = "https://open.er-api.com/v6/latest/USD"
 
+# (connect, read) timeout in seconds for every outbound API call
+API_TIMEOUT = (3, 5)
+
+# Maximum extra time (seconds) retries may add to one API call on top of the
+# first attempt; the retry count is derived from it and API_TIMEOUT
+API_RETRY_BUDGET = 12
+
+# How long cached API responses stay fresh (seconds)
+# Prices move on minute scales, FX rates on daily scales
+CRYPTO_PRICES_CACHE_TTL = 60
+FX_RATES_CACHE_TTL = 3600
+
+# Circuit breaker: after this many consecutive failures an API is skipped
+# (fallback values are used) until the reset timeout (seconds) has passed
+API_BREAKER_FAIL_MAX = 5
+API_BREAKER_RESET_TIMEOUT = 60
+
 # ============================================================================
 # BUSINESS LOGIC CONFIGURATION
 # ============================================================================
@@ -50,6 +69,26 @@ SUPPORTED_CRYPTO = ["bitcoin", "ethereum", "solana", "tether"]
 # Payment methods available on the platform
 PAYMENT_METHODS = ["credit_card", "debit_card", "ach_transfer", "sepa", "apple_pay"]
 
+# Array versions of the lists above, built once at import for vectorized sampling
+# (a generated value's position in these arrays is its category code)
+SUPPORTED_FIAT_ARR = np.array(SUPPORTED_FIAT)
+SUPPORTED_CRYPTO_ARR = np.array(SUPPORTED_CRYPTO)
+PAYMENT_METHODS_ARR = np.array(PAYMENT_METHODS)
+
+# Status/tier outcomes and their probabilities (aligned arrays) for mock data
+TRANSACTION_STATUS_ARR = np.array(["completed", "failed", "pending"])
+TRANSACTION_STATUS_P = np.array([0.85, 0.10, 0.05])
+KYC_STATUS_ARR = np.array(["verified", "pending", "rejected"])
+KYC_STATUS_P = np.array([0.70, 0.20, 0.10])
+ACCOUNT_TIER_ARR = np.array(["basic", "intermediate", "pro"])
+ACCOUNT_TIER_P = np.array([0.60, 0.30, 0.10])
+DEPOSIT_STATUS_ARR = np.array(["completed", "pending", "failed"])
+DEPOSIT_STATUS_P = np.array([0.90, 0.07, 0.03])
+WITHDRAWAL_STATUS_ARR = np.array(["completed", "pending", "failed", "rejected"])
+WITHDRAWAL_STATUS_P = np.array([0.85, 0.10, 0.03, 0.02])
+ORDER_STATUS_ARR = np.array(["filled", "open", "cancelled", "partially_filled", "expired"])
+ORDER_STATUS_P = np.array([0.40, 0.30, 0.20, 0.08, 0.02])
+
 # Number of users to generate
 NUM_USERS = 1000
 
@@ -67,6 +106,12 @@ NUM_TRADES = 2000
 # Number of orders to generate
 NUM_ORDERS = 3000
 
+# Generators split requests larger than this many records across worker processes
+GENERATOR_PARALLEL_THRESHOLD = 50_000
+
+# Maximum number of generator worker processes (defaults to all cores)
+GENERATOR_MAX_WORKERS = int(os.getenv("GENERATOR_MAX_WORKERS", os.cpu_count() or 1))
+
 # ============================================================================
 # BIGQUERY CONFIGURATION
 # ============================================================================
@@ -103,13 +148,54 @@ BQ_ORDERS_TABLE_FULL = f"{GCP_PROJECT_ID}.{BQ_DATASET}.{BQ_ORDERS_TABLE}"
 # Full table reference in BigQuery format: project.dataset.table
 BQ_TABLE_FULL = f"{GCP_PROJECT_ID}.{BQ_DATASET}.{BQ_TABLE}"
 
+# Window (days) scanned first when looking up the latest transaction date;
+# keeps the query on recent partitions in the common case
+LAST_DATE_LOOKBACK_DAYS = 30
+
+# How long fetched user_ids are reused in-process before re-reading (seconds)
+USER_IDS_CACHE_TTL = 300
+
+# DataFrames above this many rows are split into parallel load jobs
+LOAD_CHUNK_ROWS = 200_000
+
+# Maximum number of load jobs running at once for one DataFrame
+LOAD_MAX_PARALLEL_JOBS = 4
+
+# Read query results through the BigQuery Storage API (Arrow over gRPC).
+# Set BQ_USE_STORAGE_API=0 where google-cloud-bigquery-storage is unavailable.
+BQ_USE_STORAGE_API = os.getenv("BQ_USE_STORAGE_API", "1") == "1"
+
+# ============================================================================
+# LOGGING CONFIGURATION
+# ============================================================================
+
+# Log level for pipeline modules (DEBUG, INFO, WARNING, ...)
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+
 # ============================================================================
 # METADATA CONFIGURATION
 # ============================================================================
 
 # Directory for storing pipeline metadata (last run dates, etc.)
 METADATA_DIR = DATA_DIR / "metadata"
-METADATA_DIR.mkdir(parents=True, exist_ok=True)
 
 # File path for tracking last successful ingestion date
 LAST_RUN_FILE = METADATA_DIR / "last_run.json"
+
+# Local copy of the active user_ids, reused while the users table is unchanged
+# (same row count and modified time; avoids re-reading it on every run)
+USER_IDS_CACHE_FILE = METADATA_DIR / "user_ids.parquet"
+
+# SQLite cache for external API responses (requests-cache adds the .sqlite suffix)
+HTTP_CACHE_FILE = METADATA_DIR / "http_cache"
+
+
+def ensure_dirs():
+    """
+    Create the local data directories (raw CSV backups, metadata).
+    
+    Called by the pipeline entry points right before they write files,
+    so importing the package has no filesystem side effects.
+    """
+    RAW_DATA_DIR.mkdir(parents=True, exist_ok=True)
+    METADATA_DIR.mkdir(parents=True, exist_ok=True)
@@ -1,17 +1,484 @@
 """
 Mock data generation module.
-Creates realistic synthetic transaction data using Faker and business logic.
+Creates realistic synthetic transaction data using NumPy and business logic.
+
+All generators build whole columns at once with NumPy (one vectorized draw
+per column) and assemble the DataFrame from a dict of arrays, instead of
+looping over records in Python.
 """
 
-import random
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import numpy as np
 import pandas as pd
-from faker import Faker
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 from datetime import datetime, timedelta
-from typing import List, Dict
-from .config import SUPPORTED_FIAT, SUPPORTED_CRYPTO, PAYMENT_METHODS
+from typing import Callable, List, Dict, Optional, Union
+try:
+    from numba import njit, prange, set_num_threads
+except ImportError:  # numba is optional; the NumPy kernel below is used instead
+    njit = None
+from .config import (
+    SUPPORTED_FIAT, SUPPORTED_CRYPTO,
+    SUPPORTED_FIAT_ARR, SUPPORTED_CRYPTO_ARR, PAYMENT_METHODS_ARR,
+    TRANSACTION_STATUS_ARR, TRANSACTION_STATUS_P,
+    KYC_STATUS_ARR, KYC_STATUS_P, ACCOUNT_TIER_ARR, ACCOUNT_TIER_P,
+    DEPOSIT_STATUS_ARR, DEPOSIT_STATUS_P, WITHDRAWAL_STATUS_ARR, WITHDRAWAL_STATUS_P,
+    ORDER_STATUS_ARR, ORDER_STATUS_P,
+    GENERATOR_PARALLEL_THRESHOLD, GENERATOR_MAX_WORKERS
+)
+
+# ISO-3166 alpha-2 country codes, sampled in bulk for the country columns
+_COUNTRY_CODES = np.array([
+    "AD", "AE", "AF", "AG", "AL", "AM", "AO", "AR", "AT", "AU", "AZ", "BA",
+    "BB", "BD", "BE", "BF", "BG", "BH", "BI", "BJ", "BN", "BO", "BR", "BS",
+    "BT", "BW", "BY", "BZ", "CA", "CD", "CF", "CG", "CH", "CI", "CL", "CM",
+    "CN", "CO", "CR", "CU", "CV", "CY", "CZ", "DE", "DJ", "DK", "DM", "DO",
+    "DZ", "EC", "EE", "EG", "ER", "ES", "ET", "FI", "FJ", "FM", "FR", "GA",
+    "GB", "GD", "GE", "GH", "GM", "GN", "GQ", "GR", "GT", "GW", "GY", "HN",
+    "HR", "HT", "HU", "ID", "IE", "IL", "IN", "IQ", "IR", "IS", "IT", "JM",
+    "JO", "JP", "KE", "KG", "KH", "KI", "KM", "KN", "KP", "KR", "KW", "KZ",
+    "LA", "LB", "LC", "LI", "LK", "LR", "LS", "LT", "LU", "LV", "LY", "MA",
+    "MC", "MD", "ME", "MG", "MH", "MK", "ML", "MM", "MN", "MR", "MT", "MU",
+    "MV", "MW", "MX", "MY", "MZ", "NA", "NE", "NG", "NI", "NL", "NO", "NP",
+    "NR", "NZ", "OM", "PA", "PE", "PG", "PH", "PK", "PL", "PS", "PT", "PW",
+    "PY", "QA", "RO", "RS", "RU", "RW", "SA", "SB", "SC", "SD", "SE", "SG",
+    "SI", "SK", "SL", "SM", "SN", "SO", "SR", "ST", "SV", "SY", "SZ", "TD",
+    "TG", "TH", "TJ", "TL", "TM", "TN", "TO", "TR", "TT", "TV", "TW", "TZ",
+    "UA", "UG", "US", "UY", "UZ", "VA", "VC", "VE", "VN", "VU", "WS", "YE",
+    "ZA", "ZM", "ZW"
+])
+
+# Static name and domain pools for generated user emails; emails are assembled
+# from pool samples (first.last + number @ domain) instead of per-row provider calls
+_FIRST_NAMES = np.array([
+    "james", "mary", "john", "patricia", "robert", "jennifer", "michael", "linda",
+    "david", "elizabeth", "william", "barbara", "richard", "susan", "joseph", "jessica",
+    "thomas", "sarah", "daniel", "karen", "lucas", "emma", "noah", "olivia",
+    "liam", "sofia", "mateo", "mia", "hugo", "lea", "yuki", "aiko"
+])
+_LAST_NAMES = np.array([
+    "smith", "johnson", "williams", "brown", "jones", "garcia", "miller", "davis",
+    "rodriguez", "martinez", "hernandez", "lopez", "wilson", "anderson", "thomas", "taylor",
+    "moore", "jackson", "martin", "lee", "muller", "schmidt", "schneider", "fischer",
+    "dubois", "moreau", "rossi", "russo", "tanaka", "suzuki", "kim", "nguyen"
+])
+_EMAIL_DOMAINS = np.array(["gmail.com", "yahoo.com", "outlook.com", "hotmail.com", "icloud.com", "proton.me"])
+
+# Category pools for enum-like columns, which are stored as pandas Categoricals
+# (built from integer codes, so no per-row string objects are created)
+_FIAT_AND_CRYPTO = np.array(SUPPORTED_FIAT + SUPPORTED_CRYPTO)
+_TRADING_PAIRS = np.array([f"{base}/{quote}" for base in SUPPORTED_CRYPTO for quote in _FIAT_AND_CRYPTO])
+
+# Category codes of the order statuses that produce trades
+_ORDER_FILLED = int(np.flatnonzero(ORDER_STATUS_ARR == "filled")[0])
+_ORDER_PARTIALLY_FILLED = int(np.flatnonzero(ORDER_STATUS_ARR == "partially_filled")[0])
+
+# Explicit Arrow schemas for the 'arrow'/'parquet' return formats (one per table).
+# Building arrays against a known type skips type inference and keeps every
+# process-pool chunk on an identical schema (e.g. an all-null tx_hash chunk stays string).
+_DICT_STRING = pa.dictionary(pa.int32(), pa.string())
+_TIMESTAMP = pa.timestamp("us")
+
+_TRANSACTIONS_ARROW_SCHEMA = pa.schema([
+    ("transaction_id", pa.string()),
+    ("user_id", pa.string()),
+    ("timestamp", _TIMESTAMP),
+    ("fiat_currency", _DICT_STRING),
+    ("fiat_amount", pa.float64()),
+    ("crypto_token", _DICT_STRING),
+    ("crypto_amount", pa.float64()),
+    ("payment_method", _DICT_STRING),
+    ("country", _DICT_STRING),
+    ("status", _DICT_STRING),
+    ("fee_usd", pa.float64()),
+])
+
+_USERS_ARROW_SCHEMA = pa.schema([
+    ("user_id", pa.string()),
+    ("email", pa.string()),
+    ("signup_date", _TIMESTAMP),
+    ("country", _DICT_STRING),
+    ("kyc_status", _DICT_STRING),
+    ("account_tier", _DICT_STRING),
+    ("account_balance_usd", pa.float64()),
+    ("is_active", pa.bool_()),
+    ("created_at", _TIMESTAMP),
+])
+
+_DEPOSITS_ARROW_SCHEMA = pa.schema([
+    ("deposit_id", pa.string()),
+    ("user_id", pa.string()),
+    ("timestamp", _TIMESTAMP),
+    ("deposit_type", _DICT_STRING),
+    ("currency", _DICT_STRING),
+    ("amount", pa.float64()),
+    ("payment_method", _DICT_STRING),
+    ("status", _DICT_STRING),
+    ("blockchain_confirmations", pa.int64()),
+    ("created_at", _TIMESTAMP),
+])
+
+_WITHDRAWALS_ARROW_SCHEMA = pa.schema([
+    ("withdrawal_id", pa.string()),
+    ("user_id", pa.string()),
+    ("timestamp", _TIMESTAMP),
+    ("withdrawal_type", _DICT_STRING),
+    ("currency", _DICT_STRING),
+    ("amount", pa.float64()),
+    ("fee", pa.float64()),
+    ("destination_type", _DICT_STRING),
+    ("tx_hash", pa.string()),
+    ("status", _DICT_STRING),
+    ("created_at", _TIMESTAMP),
+])
+
+_TRADES_ARROW_SCHEMA = pa.schema([
+    ("trade_id", pa.string()),
+    ("user_id", pa.string()),
+    ("timestamp", _TIMESTAMP),
+    ("trading_pair", _DICT_STRING),
+    ("side", _DICT_STRING),
+    ("base_currency", _DICT_STRING),
+    ("quote_currency", _DICT_STRING),
+    ("base_amount", pa.float64()),
+    ("quote_amount", pa.float64()),
+    ("price", pa.float64()),
+    ("fee_amount", pa.float64()),
+    ("fee_currency", _DICT_STRING),
+    ("order_type", _DICT_STRING),
+    ("is_maker", pa.bool_()),
+    ("created_at", _TIMESTAMP),
+])
+
+_ORDERS_ARROW_SCHEMA = pa.schema([
+    ("order_id", pa.string()),
+    ("user_id", pa.string()),
+    ("timestamp", _TIMESTAMP),
+    ("trading_pair", _DICT_STRING),
+    ("side", _DICT_STRING),
+    ("order_type", _DICT_STRING),
+    ("base_currency", _DICT_STRING),
+    ("quote_currency", _DICT_STRING),
+    ("base_amount", pa.float64()),
+    ("filled_amount", pa.float64()),
+    ("limit_price", pa.float64()),
+    ("status", _DICT_STRING),
+    ("created_at", _TIMESTAMP),
+])
+
+# Lookup table for hex-encoding UUID bytes
+_HEX_DIGITS = np.frombuffer(b"0123456789abcdef", dtype="S1")
+
+
+def bulk_uuids(n: int, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """
+    Generates n random (version 4) UUID strings in one vectorized pass.
+    
+    Draws 16*n random bytes at once, sets the version/variant bits on the
+    whole byte matrix, then hex-encodes and inserts dashes with array ops
+    instead of calling uuid.uuid4() once per row.
+    
+    Args:
+        n: Number of UUIDs to generate
+        rng: Optional NumPy Generator to draw the bytes from, so IDs are
+            reproducible along with the rest of a seeded dataset
+            (os.urandom if omitted)
+    
+    Returns:
+        np.ndarray: Array of canonical UUID strings (e.g. '1b4e28ba-2fa1-4d2e-...')
+    """
+    random_bytes = rng.bytes(16 * n) if rng is not None else os.urandom(16 * n)
+    raw = np.frombuffer(random_bytes, dtype=np.uint8).reshape(n, 16).copy()
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40  # version 4
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80  # RFC 4122 variant
+    
+    chars = np.insert(_hex_chars(raw), [8, 12, 16, 20], b"-", axis=1)
+    return chars.view("S36").ravel().astype(str)
+
+
+def _hex_chars(raw: np.ndarray) -> np.ndarray:
+    """Hex-encodes an (n, m) uint8 byte matrix into an (n, 2m) matrix of hex characters."""
+    # Split each byte into two nibbles and map them to hex characters
+    nibbles = np.empty((raw.shape[0], 2 * raw.shape[1]), dtype=np.uint8)
+    nibbles[:, 0::2] = raw >> 4
+    nibbles[:, 1::2] = raw & 0x0F
+    return _HEX_DIGITS[nibbles]
+
+
+def _random_hex_strings(rng: np.random.Generator, n: int, num_bytes: int) -> np.ndarray:
+    """Draws n random hex strings of num_bytes bytes each (e.g. 32 for a tx hash) from rng."""
+    raw = np.frombuffer(rng.bytes(num_bytes * n), dtype=np.uint8).reshape(n, num_bytes)
+    return _hex_chars(raw).view(f"S{2 * num_bytes}").ravel().astype(str)
+
+
+def _random_timestamps(rng: np.random.Generator, n: int, target_date: datetime = None) -> np.ndarray:
+    """
+    Draws n event timestamps as a datetime64[ns] array (no per-row datetime objects).
+    
+    With target_date: uniformly within that day ([0, 86400) seconds after
+    midnight, so every row lands in that day's table partition).
+    Without: within the last 90 days (random day + random minute offset).
+    """
+    if target_date:
+        start_of_day = np.datetime64(target_date, "D").astype("datetime64[s]")
+        offsets = rng.integers(0, 86400, n).astype("timedelta64[s]")
+        return (start_of_day + offsets).astype("datetime64[ns]")
+    
+    now = np.datetime64(datetime.now(), "us")
+    days_ago = rng.integers(0, 90, n, endpoint=True).astype("timedelta64[D]")
+    minutes = rng.integers(0, 1440, n, endpoint=True).astype("timedelta64[m]")
+    return (now - days_ago - minutes).astype("datetime64[ns]")
+
+
+# Output formats supported by the generate_mock_* functions
+RETURN_FORMATS = ("pandas", "arrow", "parquet")
+
+
+def _columns_to_format(
+    columns: Dict[str, object],
+    return_format: str,
+    arrow_schema: pa.Schema
+) -> Union[pd.DataFrame, pa.Table]:
+    """
+    Wraps generated column arrays as a DataFrame, or straight into an Arrow table.
+    
+    Arrow arrays are built against arrow_schema, so no type inference runs. The
+    pandas path adopts the NumPy/Categorical arrays directly (an Arrow round trip
+    would re-materialize every string column).
+    """
+    if return_format == "pandas":
+        return pd.DataFrame(columns, copy=False)
+    arrays = [pa.array(columns[field.name], type=field.type) for field in arrow_schema]
+    return pa.Table.from_arrays(arrays, schema=arrow_schema)
+
+
+def _init_generator_worker() -> None:
+    """
+    Pool worker initializer: limit numba's kernel to one thread per process.
+    
+    The pool already runs one worker per core, so a full-width numba thread
+    pool in every worker would oversubscribe the CPU (workers x cores threads).
+    """
+    if njit is not None:
+        set_num_threads(1)
+
+
+def _run_builder(
+    builder: Callable[..., Dict[str, object]],
+    rng: np.random.Generator,
+    n: int,
+    args: tuple,
+    return_format: str,
+    arrow_schema: pa.Schema
+) -> Union[pd.DataFrame, pa.Table]:
+    """Runs one generator chunk in a worker process with its own independent RNG stream."""
+    return _columns_to_format(builder(rng, n, *args), return_format, arrow_schema)
+
+
+def _generate_in_parallel(
+    builder: Callable[..., Dict[str, object]],
+    n: int,
+    *args,
+    arrow_schema: pa.Schema,
+    rng: Optional[np.random.Generator] = None,
+    return_format: str = "pandas",
+    output_path: str = None
+) -> Union[pd.DataFrame, pa.Table, str]:
+    """
+    Runs a _build_* generator, splitting large requests across processes.
+    
+    Records are independent given their RNG, so above GENERATOR_PARALLEL_THRESHOLD
+    rows the work is split into one chunk per worker, each drawing from a child
+    of rng created with Generator.spawn() (statistically independent streams,
+    reproducible when rng is seeded).
+    
+    Args:
+        builder: Module-level _build_* function taking (rng, n, *args)
+        n: Total number of records to generate
+        *args: Remaining builder arguments (must be picklable)
+        arrow_schema: Arrow schema of the table the builder produces
+        rng: Random generator to draw from (fresh unseeded one if omitted)
+        return_format: 'pandas' (DataFrame), 'arrow' (pyarrow.Table) or
+            'parquet' (zstd-compressed file written to output_path)
+        output_path: Destination file, required when return_format='parquet'
+    
+    Returns:
+        DataFrame, Arrow table, or the written Parquet path (per return_format)
+    """
+    if return_format not in RETURN_FORMATS:
+        raise ValueError(f"return_format must be one of {RETURN_FORMATS}, got {return_format!r}")
+    if return_format == "parquet" and not output_path:
+        raise ValueError("output_path must be provided when return_format='parquet'")
+    
+    if rng is None:
+        rng = np.random.default_rng()
+    
+    # Parquet output is written from Arrow, never through pandas
+    chunk_format = "pandas" if return_format == "pandas" else "arrow"
+    
+    num_workers = min(GENERATOR_MAX_WORKERS, n // GENERATOR_PARALLEL_THRESHOLD + 1)
+    if n <= GENERATOR_PARALLEL_THRESHOLD or num_workers <= 1:
+        result = _columns_to_format(builder(rng, n, *args), chunk_format, arrow_schema)
+    else:
+        # Even split, remainder spread over the first chunks
+        sizes = [n // num_workers + (1 if i < n % num_workers else 0) for i in range(num_workers)]
+        worker_rngs = rng.spawn(num_workers)
+        
+        # Spawn (not fork) workers: forking after numba's parallel kernel has started
+        # its thread pool can leave the children deadlocked at exit
+        spawn_context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(
+            max_workers=num_workers, mp_context=spawn_context, initializer=_init_generator_worker
+        ) as executor:
+            chunks = list(executor.map(
+                _run_builder, repeat(builder), worker_rngs, sizes, repeat(args),
+                repeat(chunk_format), repeat(arrow_schema)
+            ))
+        
+        if chunk_format == "pandas":
+            result = pd.concat(chunks, ignore_index=True, copy=False)
+        else:
+            result = pa.concat_tables(chunks)
+    
+    if return_format == "parquet":
+        pq.write_table(result, output_path, compression="zstd")
+        return str(output_path)
+    
+    return result
+
+
+def _lookup_table(values: Dict[str, float], keys: np.ndarray, default: float) -> np.ndarray:
+    """Freezes a currency -> value dict into an array aligned with keys (indexed by category code)."""
+    return np.array([values.get(key, default) for key in keys], dtype=np.float64)
+
+
+def _compute_amounts_numpy(
+    fiat_amount: np.ndarray,
+    fx_table: np.ndarray,
+    fiat_idx: np.ndarray,
+    price_table: np.ndarray,
+    crypto_idx: np.ndarray,
+    fee_rate: float
+) -> tuple:
+    """
+    Converts fiat amounts to (crypto_amount, fee_usd) for on-ramp transactions.
+    
+    fiat -> USD via fx_table[fiat_idx], minus fee_rate, -> crypto via
+    price_table[crypto_idx] (0 where the token price is unknown).
+    Results are quantized to 8 (crypto) and 2 (USD) decimals by
+    scale -> np.rint -> unscale, done in place.
+    """
+    amount_in_usd = fiat_amount / fx_table[fiat_idx]
+    token_price_usd = price_table[crypto_idx]
+    crypto_amount = np.divide(
+        amount_in_usd * (1 - fee_rate), token_price_usd,
+        out=np.zeros(len(fiat_amount)), where=token_price_usd > 0
+    )
+    fee_usd = np.multiply(amount_in_usd, fee_rate, out=amount_in_usd)
+    
+    for values, scale in ((crypto_amount, 1e8), (fee_usd, 1e2)):
+        np.multiply(values, scale, out=values)
+        np.rint(values, out=values)
+        np.divide(values, scale, out=values)
+    return crypto_amount, fee_usd
+
+
+if njit is not None:
+    # fastmath without 'reassoc'/'arcp': dividing by the scale must stay a true
+    # division, or the quantized values drift off the NumPy results by an ulp
+    @njit(parallel=True, fastmath={"nnan", "ninf", "nsz", "contract", "afn"}, cache=True)
+    def _compute_amounts(fiat_amount, fx_table, fiat_idx, price_table, crypto_idx, fee_rate):
+        """Fused single-pass version of _compute_amounts_numpy (no temporary arrays)."""
+        n = fiat_amount.shape[0]
+        crypto_amount = np.empty(n)
+        fee_usd = np.empty(n)
+        for i in prange(n):
+            amount_in_usd = fiat_amount[i] / fx_table[fiat_idx[i]]
+            token_price_usd = price_table[crypto_idx[i]]
+            if token_price_usd > 0:
+                crypto_amount[i] = np.rint(amount_in_usd * (1.0 - fee_rate) / token_price_usd * 1e8) / 1e8
+            else:
+                crypto_amount[i] = 0.0
+            fee_usd[i] = np.rint(amount_in_usd * fee_rate * 1e2) / 1e2
+        return crypto_amount, fee_usd
+else:
+    _compute_amounts = _compute_amounts_numpy
+
 
-# Initialize Faker for generating realistic fake data (names, UUIDs, countries, etc.)
-fake = Faker()
+def _build_ramp_data(
+    rng: np.random.Generator,
+    n: int,
+    crypto_prices: Dict[str, float],
+    fx_rates: Dict[str, float],
+    target_date: datetime,
+    user_ids: np.ndarray
+) -> Dict[str, object]:
+    """Builds the columns for n on-ramp transactions from rng (worker for generate_mock_ramp_data)."""
+    # ========================================================================
+    # TIMESTAMP GENERATION
+    # ========================================================================
+    # Within target_date if given (incremental loading), else last 90 days
+    timestamps = _random_timestamps(rng, n, target_date)
+    
+    # ========================================================================
+    # FIAT SIDE (What the user pays)
+    # ========================================================================
+    # Draw currency indices so FX rates can be looked up by position
+    fiat_idx = rng.integers(0, len(SUPPORTED_FIAT), n)
+    fiat_currency = pd.Categorical.from_codes(fiat_idx, categories=SUPPORTED_FIAT_ARR)
+    
+    # Generate realistic transaction amount ($20 to $5000)
+    # In production, this would be weighted towards smaller amounts
+    fiat_amount = np.round(rng.uniform(20.0, 5000.0, n), 2)
+    
+    # ========================================================================
+    # CRYPTO SIDE (What the user receives)
+    # ========================================================================
+    crypto_idx = rng.integers(0, len(SUPPORTED_CRYPTO), n)
+    crypto_token = pd.Categorical.from_codes(crypto_idx, categories=SUPPORTED_CRYPTO_ARR)
+    
+    # ========================================================================
+    # AMOUNT CALCULATION (2-step conversion)
+    # ========================================================================
+    
+    # Step 1: Convert user's fiat currency to USD
+    # Example: 100 EUR → 100 / 0.92 = ~108.70 USD
+    # Step 2: Deduct platform fee (1.5% of USD value)
+    # Step 3: Convert net USD amount to cryptocurrency
+    # Example: $1000 USD / $50,000 BTC price = 0.02 BTC (0 if price unknown)
+    fx_table = _lookup_table(fx_rates, SUPPORTED_FIAT_ARR, 1.0)
+    price_table = _lookup_table(crypto_prices, SUPPORTED_CRYPTO_ARR, 0)
+    # (rounded to 8 decimals for crypto, 2 for the USD fee)
+    crypto_amount, fee_usd = _compute_amounts(fiat_amount, fx_table, fiat_idx, price_table, crypto_idx, 0.015)
+    
+    # ========================================================================
+    # BUILD TRANSACTION COLUMNS
+    # ========================================================================
+    return {
+        "transaction_id": bulk_uuids(n, rng),    # Unique transaction identifier
+        "user_id": user_ids[rng.integers(0, len(user_ids), n)],  # Use real user_id from users table
+        "timestamp": timestamps,                               # When transaction occurred
+        "fiat_currency": fiat_currency,                        # What user paid with
+        "fiat_amount": fiat_amount,                            # How much user paid
+        "crypto_token": crypto_token,                          # What user bought
+        "crypto_amount": crypto_amount,                        # How much crypto received (8 decimals standard)
+        "payment_method": pd.Categorical.from_codes(           # How user paid
+            rng.integers(0, len(PAYMENT_METHODS_ARR), n), categories=PAYMENT_METHODS_ARR
+        ),
+        "country": pd.Categorical.from_codes(                  # User's country (e.g., 'US', 'DE', 'JP')
+            rng.integers(0, len(_COUNTRY_CODES), n), categories=_COUNTRY_CODES
+        ),
+        # Transaction status with weighted probabilities (realistic conversion funnel)
+        "status": pd.Categorical.from_codes(
+            rng.choice(len(TRANSACTION_STATUS_ARR), size=n, p=TRANSACTION_STATUS_P), categories=TRANSACTION_STATUS_ARR
+        ),
+        "fee_usd": fee_usd                                     # Fee charged in USD
+    }
 
 
 def generate_mock_ramp_data(
@@ -19,8 +486,11 @@ def generate_mock_ramp_data(
     crypto_prices: Dict[str, float], 
     fx_rates: Dict[str, float],
     target_date: datetime = None,  # Added parameter for date-specific generation
-    user_ids: List[str] = None  # Added parameter for real user_ids
-) -> pd.DataFrame:
+    user_ids: List[str] = None,  # Added parameter for real user_ids
+    rng: Optional[np.random.Generator] = None,
+    return_format: str = "pandas",
+    output_path: str = None
+) -> Union[pd.DataFrame, pa.Table, str]:
     """
     Generates mock fiat-to-crypto on-ramp transactions with realistic patterns.
     
@@ -30,9 +500,14 @@ def generate_mock_ramp_data(
         fx_rates: Exchange rates for fiat currencies
         target_date: Optional specific date to generate transactions for (for incremental loading)
         user_ids: List of real user_ids from the users table (ensures referential integrity)
+        rng: Optional NumPy Generator (pass a seeded one for reproducible data)
+        return_format: 'pandas' (default), 'arrow' for a pyarrow.Table, or 'parquet'
+            to write straight to output_path without building a DataFrame
+        output_path: Parquet destination (required for return_format='parquet')
     
     Returns:
         pd.DataFrame: Synthetic transaction data ready for analysis
+        (pyarrow.Table or the Parquet file path for the other return formats)
         
     Business Logic:
         - Transaction amounts follow a realistic distribution (mostly small, some large)
@@ -40,108 +515,93 @@ def generate_mock_ramp_data(
         - 1.5% platform fee is deducted before crypto purchase
         - 85% completed, 10% failed, 5% pending (realistic conversion rates)
     """
-    if not user_ids:
+    if user_ids is None or len(user_ids) == 0:
         raise ValueError("user_ids must be provided to ensure referential integrity with users table")
     
-    records = []
+    # Convert once so every worker samples by integer index into one array
+    user_ids = np.asarray(user_ids, dtype=object)
     
     print(f"🔄 Generating {num_records} mock transactions...")
     
-    for _ in range(num_records):
-        # ====================================================================
-        # TIMESTAMP GENERATION
-        # ====================================================================
-        if target_date:
-            # If target_date is provided, generate timestamp within that specific day
-            start_of_day = datetime.combine(target_date, datetime.min.time())
-            # Random time throughout the 24-hour period (0-86400 seconds)
-            random_seconds = random.randint(0, 86400)
-            txn_date = start_of_day + timedelta(seconds=random_seconds)
-        else:
-            # Original behavior: Generate transaction date within last 90 days
-            # Skewed towards recent activity (random uniform distribution)
-            days_ago = random.randint(0, 90)
-            # Add random time within that day
-            txn_date = datetime.now() - timedelta(days=days_ago, minutes=random.randint(0, 1440))
-        
-        # ====================================================================
-        # USER & GEOGRAPHIC DATA
-        # ====================================================================
-        # Use Faker to generate realistic country codes (e.g., 'US', 'DE', 'JP')
-        country_code = fake.country_code()
-        
-        # ====================================================================
-        # FIAT SIDE (What the user pays)
-        # ====================================================================
-        # Randomly select which fiat currency the user pays in
-        fiat_currency = random.choice(SUPPORTED_FIAT)
-        
-        # Generate realistic transaction amount ($20 to $5000)
-        # In production, this would be weighted towards smaller amounts
-        fiat_amount = round(random.uniform(20.0, 5000.0), 2)
-        
-        # ====================================================================
-        # CRYPTO SIDE (What the user receives)
-        # ====================================================================
-        # Randomly select which cryptocurrency the user wants to buy
-        crypto_token = random.choice(SUPPORTED_CRYPTO)
-        
-        # ====================================================================
-        # AMOUNT CALCULATION (2-step conversion)
-        # ====================================================================
-        
-        # Step 1: Convert user's fiat currency to USD
-        # Example: 100 EUR → 100 / 0.92 = ~108.70 USD
-        usd_rate = fx_rates.get(fiat_currency, 1.0)
-        amount_in_usd = fiat_amount / usd_rate
-        
-        # Step 2: Deduct platform fee (1.5% of USD value)
-        fee_rate = 0.015
-        net_amount_usd = amount_in_usd * (1 - fee_rate)
-        
-        # Step 3: Convert net USD amount to cryptocurrency
-        # Example: $1000 USD / $50,000 BTC price = 0.02 BTC
-        token_price_usd = crypto_prices.get(crypto_token, 0)
-        crypto_amount = net_amount_usd / token_price_usd if token_price_usd > 0 else 0
-        
-        # ====================================================================
-        # BUILD TRANSACTION RECORD
-        # ====================================================================
-        record = {
-            "transaction_id": fake.uuid4(),          # Unique transaction identifier
-            "user_id": random.choice(user_ids),     # Use real user_id from users table
-            "timestamp": txn_date,                    # When transaction occurred
-            "fiat_currency": fiat_currency,           # What user paid with
-            "fiat_amount": fiat_amount,               # How much user paid
-            "crypto_token": crypto_token,             # What user bought
-            "crypto_amount": round(crypto_amount, 8), # How much crypto received (8 decimals standard)
-            "payment_method": random.choice(PAYMENT_METHODS),  # How user paid
-            "country": country_code,                  # User's country
-            # Transaction status with weighted probabilities (realistic conversion funnel)
-            "status": random.choices(
-                ["completed", "failed", "pending"], 
-                weights=[0.85, 0.10, 0.05]
-            )[0],
-            "fee_usd": round(amount_in_usd * fee_rate, 2)  # Fee charged in USD
-        }
-        
-        records.append(record)
+    return _generate_in_parallel(
+        _build_ramp_data, num_records, crypto_prices, fx_rates, target_date, user_ids,
+        arrow_schema=_TRANSACTIONS_ARROW_SCHEMA, rng=rng,
+        return_format=return_format, output_path=output_path
+    )
+
+def _random_emails(rng: np.random.Generator, n: int) -> np.ndarray:
+    """
+    Draws n email addresses from the static name/domain pools.
+    
+    A numeric suffix (0-999999) keeps collisions rare (32*32*1M local parts);
+    occasional duplicates are acceptable for mock data.
+    """
+    local_part = np.char.add(
+        np.char.add(rng.choice(_FIRST_NAMES, size=n), "."),
+        np.char.add(rng.choice(_LAST_NAMES, size=n), rng.integers(0, 1_000_000, n).astype(str))
+    )
+    return np.char.add(np.char.add(local_part, "@"), rng.choice(_EMAIL_DOMAINS, size=n)).astype(object)
+
+
+def _build_users(
+    rng: np.random.Generator,
+    n: int,
+    start_date: datetime
+) -> Dict[str, object]:
+    """Builds the columns for n user accounts from rng (worker for generate_mock_users)."""
+    # Signup date - weighted towards recent signups
+    days_since_start = rng.integers(0, 730, n, endpoint=True).astype("timedelta64[D]")
+    signup_date = (np.datetime64(start_date, "us") + days_since_start).astype("datetime64[ns]")
     
-    # Convert list of dictionaries to pandas DataFrame
-    df = pd.DataFrame(records)
+    # Initial account balance (70% of users start with $0, some deposit immediately)
+    initial_balance = np.where(
+        rng.random(n) < 0.3,
+        np.round(rng.uniform(100, 10000, n), 2),
+        0.0
+    )
     
-    return df
+    return {
+        "user_id": bulk_uuids(n, rng),
+        "email": _random_emails(rng, n),
+        "signup_date": signup_date,
+        "country": pd.Categorical.from_codes(
+            rng.integers(0, len(_COUNTRY_CODES), n), categories=_COUNTRY_CODES
+        ),
+        # KYC status with realistic distribution
+        "kyc_status": pd.Categorical.from_codes(
+            rng.choice(len(KYC_STATUS_ARR), size=n, p=KYC_STATUS_P), categories=KYC_STATUS_ARR
+        ),
+        # Account tier (higher tiers are less common)
+        "account_tier": pd.Categorical.from_codes(
+            rng.choice(len(ACCOUNT_TIER_ARR), size=n, p=ACCOUNT_TIER_P), categories=ACCOUNT_TIER_ARR
+        ),
+        "account_balance_usd": initial_balance,
+        "is_active": rng.random(n) < 0.9,  # 90% active
+        "created_at": signup_date
+    }
+
 
-def generate_mock_users(num_users: int, start_date: datetime = None) -> pd.DataFrame:
+def generate_mock_users(
+    num_users: int,
+    start_date: datetime = None,
+    rng: Optional[np.random.Generator] = None,
+    return_format: str = "pandas",
+    output_path: str = None
+) -> Union[pd.DataFrame, pa.Table, str]:
     """
     Generates mock user accounts with realistic patterns.
     
     Args:
         num_users: Number of user accounts to generate
         start_date: Earliest possible signup date (defaults to 2 years ago)
+        rng: Optional NumPy Generator (pass a seeded one for reproducible data)
+        return_format: 'pandas' (default), 'arrow' for a pyarrow.Table, or 'parquet'
+            to write straight to output_path without building a DataFrame
+        output_path: Parquet destination (required for return_format='parquet')
     
     Returns:
         pd.DataFrame: Synthetic user data
+        (pyarrow.Table or the Parquet file path for the other return formats)
         
     Business Logic:
         - Users sign up over time (weighted towards recent)
@@ -149,418 +609,449 @@ def generate_mock_users(num_users: int, start_date: datetime = None) -> pd.DataF
         - Account tiers: 60% basic, 30% intermediate, 10% pro
         - Each user has unique email and persistent user_id
     """
-    records = []
-    
     if start_date is None:
         # Default: Users could have signed up anytime in last 2 years
         start_date = datetime.now() - timedelta(days=730)
     
     print(f"👥 Generating {num_users} mock users...")
     
-    for _ in range(num_users):
-        # Signup date - weighted towards recent signups
-        days_since_start = random.randint(0, 730)
-        signup_date = start_date + timedelta(days=days_since_start)
-        
-        # User demographics
-        country_code = fake.country_code()
-        
-        # KYC status with realistic distribution
-        kyc_status = random.choices(
-            ["verified", "pending", "rejected"],
-            weights=[0.70, 0.20, 0.10]
-        )[0]
-        
-        # Account tier (higher tiers are less common)
-        account_tier = random.choices(
-            ["basic", "intermediate", "pro"],
-            weights=[0.60, 0.30, 0.10]
-        )[0]
-        
-        # Initial account balance (most users start with $0, some deposit immediately)
-        initial_balance = random.choice([0.0] * 7 + [round(random.uniform(100, 10000), 2)] * 3)
-        
-        record = {
-            "user_id": fake.uuid4(),
-            "email": fake.email(),
-            "signup_date": signup_date,
-            "country": country_code,
-            "kyc_status": kyc_status,
-            "account_tier": account_tier,
-            "account_balance_usd": initial_balance,
-            "is_active": random.choice([True] * 9 + [False]),  # 90% active
-            "created_at": signup_date
-        }
-        
-        records.append(record)
+    return _generate_in_parallel(
+        _build_users, num_users, start_date,
+        arrow_schema=_USERS_ARROW_SCHEMA, rng=rng,
+        return_format=return_format, output_path=output_path
+    )
+
+def _build_deposits(
+    rng: np.random.Generator,
+    n: int,
+    target_date: datetime,
+    user_ids: np.ndarray
+) -> Dict[str, object]:
+    """Builds the columns for n deposits from rng (worker for generate_mock_deposits)."""
+    # Timestamp generation
+    deposit_date = _random_timestamps(rng, n, target_date)
+    
+    # Determine if fiat or crypto deposit (70% fiat)
+    is_fiat = rng.random(n) < 0.7
     
-    df = pd.DataFrame(records)
-    return df
+    is_crypto = ~is_fiat
+    num_fiat = int(is_fiat.sum())
+    num_crypto = n - num_fiat
+    
+    # Fill each half of preallocated columns with its own draw (no per-row branching)
+    # Currency and payment method hold category codes into _FIAT_AND_CRYPTO / deposit_methods
+    deposit_methods = ["bank_transfer", "wire", "ach_transfer", "sepa", "blockchain"]
+    currency = np.empty(n, dtype=np.int64)
+    amount = np.empty(n, dtype=np.float64)
+    payment_method = np.empty(n, dtype=np.int64)
+    confirmations = pd.array(np.full(n, pd.NA), dtype="Int64")
+    
+    # Fiat deposits: fiat currency, $50-$10000, bank rails
+    currency[is_fiat] = rng.integers(0, len(SUPPORTED_FIAT), num_fiat)
+    amount[is_fiat] = np.round(rng.uniform(50.0, 10000.0, num_fiat), 2)
+    payment_method[is_fiat] = rng.integers(0, 4, num_fiat)
+    
+    # Crypto deposits: crypto token, 0.001-10 units, on-chain
+    # Blockchain confirmations only exist for crypto deposits
+    currency[is_crypto] = len(SUPPORTED_FIAT) + rng.integers(0, len(SUPPORTED_CRYPTO), num_crypto)
+    amount[is_crypto] = np.round(rng.uniform(0.001, 10.0, num_crypto), 8)
+    payment_method[is_crypto] = 4
+    confirmations[is_crypto] = rng.integers(1, 20, num_crypto, endpoint=True)
+    
+    return {
+        "deposit_id": bulk_uuids(n, rng),
+        "user_id": user_ids[rng.integers(0, len(user_ids), n)],  # Use real user_id
+        "timestamp": deposit_date,
+        "deposit_type": pd.Categorical.from_codes(is_crypto.astype(np.int8), categories=["fiat", "crypto"]),
+        "currency": pd.Categorical.from_codes(currency, categories=_FIAT_AND_CRYPTO),
+        "amount": amount,
+        "payment_method": pd.Categorical.from_codes(payment_method, categories=deposit_methods),
+        # Status distribution
+        "status": pd.Categorical.from_codes(
+            rng.choice(len(DEPOSIT_STATUS_ARR), size=n, p=DEPOSIT_STATUS_P), categories=DEPOSIT_STATUS_ARR
+        ),
+        "blockchain_confirmations": confirmations,
+        "created_at": deposit_date
+    }
+
 
 def generate_mock_deposits(
     num_deposits: int, 
     target_date: datetime = None,
-    user_ids: List[str] = None  # Added parameter
-) -> pd.DataFrame:
+    user_ids: List[str] = None,  # Added parameter
+    rng: Optional[np.random.Generator] = None,
+    return_format: str = "pandas",
+    output_path: str = None
+) -> Union[pd.DataFrame, pa.Table, str]:
     """
     Generates mock deposit transactions (fiat and crypto).
     """
-    if not user_ids:
+    if user_ids is None or len(user_ids) == 0:
         raise ValueError("user_ids must be provided to ensure referential integrity with users table")
     
-    records = []
+    # Convert once so every worker samples by integer index into one array
+    user_ids = np.asarray(user_ids, dtype=object)
     
     print(f"💰 Generating {num_deposits} mock deposits...")
     
-    for _ in range(num_deposits):
-        # Timestamp generation
-        if target_date:
-            start_of_day = datetime.combine(target_date, datetime.min.time())
-            random_seconds = random.randint(0, 86400)
-            deposit_date = start_of_day + timedelta(seconds=random_seconds)
-        else:
-            days_ago = random.randint(0, 90)
-            deposit_date = datetime.now() - timedelta(days=days_ago, minutes=random.randint(0, 1440))
-        
-        # Determine if fiat or crypto deposit
-        is_fiat = random.random() < 0.7
-        
-        if is_fiat:
-            # Fiat deposit
-            currency = random.choice(SUPPORTED_FIAT)
-            amount = round(random.uniform(50.0, 10000.0), 2)
-            deposit_type = "fiat"
-            payment_method = random.choice(["bank_transfer", "wire", "ach_transfer", "sepa"])
-        else:
-            # Crypto deposit
-            currency = random.choice(SUPPORTED_CRYPTO)
-            amount = round(random.uniform(0.001, 10.0), 8)
-            deposit_type = "crypto"
-            payment_method = "blockchain"
-        
-        # Status distribution
-        status = random.choices(
-            ["completed", "pending", "failed"],
-            weights=[0.90, 0.07, 0.03]
-        )[0]
-        
-        record = {
-            "deposit_id": fake.uuid4(),
-            "user_id": random.choice(user_ids),  # Use real user_id
-            "timestamp": deposit_date,
-            "deposit_type": deposit_type,
-            "currency": currency,
-            "amount": amount,
-            "payment_method": payment_method,
-            "status": status,
-            "blockchain_confirmations": random.randint(1, 20) if not is_fiat else None,
-            "created_at": deposit_date
-        }
-        
-        records.append(record)
+    return _generate_in_parallel(
+        _build_deposits, num_deposits, target_date, user_ids,
+        arrow_schema=_DEPOSITS_ARROW_SCHEMA, rng=rng,
+        return_format=return_format, output_path=output_path
+    )
+
+def _build_withdrawals(
+    rng: np.random.Generator,
+    n: int,
+    target_date: datetime,
+    user_ids: np.ndarray
+) -> Dict[str, object]:
+    """Builds the columns for n withdrawals from rng (worker for generate_mock_withdrawals)."""
+    # Timestamp generation
+    withdrawal_date = _random_timestamps(rng, n, target_date)
+    
+    # Determine if fiat or crypto withdrawal (60% crypto)
+    is_crypto = rng.random(n) < 0.6
+    
+    is_fiat = ~is_crypto
+    num_crypto = int(is_crypto.sum())
+    num_fiat = n - num_crypto
+    
+    # Fill each half of preallocated columns with its own draw (no per-row branching)
+    # Currency and destination hold category codes into _FIAT_AND_CRYPTO / destinations
+    destinations = ["wallet_address", "bank_account", "card"]
+    currency = np.empty(n, dtype=np.int64)
+    amount = np.empty(n, dtype=np.float64)
+    destination_type = np.empty(n, dtype=np.int64)
+    tx_hash = np.full(n, None, dtype=object)
+    
+    # Crypto withdrawals: token, 0.001-5 units, to a wallet address
+    currency[is_crypto] = len(SUPPORTED_FIAT) + rng.integers(0, len(SUPPORTED_CRYPTO), num_crypto)
+    amount[is_crypto] = np.round(rng.uniform(0.001, 5.0, num_crypto), 8)
+    destination_type[is_crypto] = 0
     
-    df = pd.DataFrame(records)
-    return df
+    # Fiat withdrawals: fiat currency, $100-$50000, to a bank account or card
+    currency[is_fiat] = rng.integers(0, len(SUPPORTED_FIAT), num_fiat)
+    amount[is_fiat] = np.round(rng.uniform(100.0, 50000.0, num_fiat), 2)
+    destination_type[is_fiat] = rng.integers(1, 3, num_fiat)
+    
+    # 85% of crypto withdrawals already have an on-chain transaction hash
+    has_tx_hash = is_crypto & (rng.random(n) < 0.85)
+    tx_hash[has_tx_hash] = _random_hex_strings(rng, int(has_tx_hash.sum()), 32)
+    
+    # Fee (0.5% for crypto, $10 flat for fiat)
+    fee = np.where(is_crypto, np.round(amount * 0.005, 8), 10.0)
+    
+    return {
+        "withdrawal_id": bulk_uuids(n, rng),
+        "user_id": user_ids[rng.integers(0, len(user_ids), n)],  # Use real user_id
+        "timestamp": withdrawal_date,
+        "withdrawal_type": pd.Categorical.from_codes(is_fiat.astype(np.int8), categories=["crypto", "fiat"]),
+        "currency": pd.Categorical.from_codes(currency, categories=_FIAT_AND_CRYPTO),
+        "amount": amount,
+        "fee": fee,
+        "destination_type": pd.Categorical.from_codes(destination_type, categories=destinations),
+        "tx_hash": tx_hash,
+        # Status distribution
+        "status": pd.Categorical.from_codes(
+            rng.choice(len(WITHDRAWAL_STATUS_ARR), size=n, p=WITHDRAWAL_STATUS_P),
+            categories=WITHDRAWAL_STATUS_ARR
+        ),
+        "created_at": withdrawal_date
+    }
+
 
 def generate_mock_withdrawals(
     num_withdrawals: int, 
     target_date: datetime = None,
-    user_ids: List[str] = None  # Added parameter
-) -> pd.DataFrame:
+    user_ids: List[str] = None,  # Added parameter
+    rng: Optional[np.random.Generator] = None,
+    return_format: str = "pandas",
+    output_path: str = None
+) -> Union[pd.DataFrame, pa.Table, str]:
     """
     Generates mock withdrawal transactions (fiat and crypto).
     """
-    if not user_ids:
+    if user_ids is None or len(user_ids) == 0:
         raise ValueError("user_ids must be provided to ensure referential integrity with users table")
     
-    records = []
+    # Convert once so every worker samples by integer index into one array
+    user_ids = np.asarray(user_ids, dtype=object)
     
     print(f"💸 Generating {num_withdrawals} mock withdrawals...")
     
-    for _ in range(num_withdrawals):
-        # Timestamp generation
-        if target_date:
-            start_of_day = datetime.combine(target_date, datetime.min.time())
-            random_seconds = random.randint(0, 86400)
-            withdrawal_date = start_of_day + timedelta(seconds=random_seconds)
-        else:
-            days_ago = random.randint(0, 90)
-            withdrawal_date = datetime.now() - timedelta(days=days_ago, minutes=random.randint(0, 1440))
-        
-        # Determine if fiat or crypto withdrawal
-        is_crypto = random.random() < 0.6
-        
-        if is_crypto:
-            # Crypto withdrawal
-            currency = random.choice(SUPPORTED_CRYPTO)
-            amount = round(random.uniform(0.001, 5.0), 8)
-            withdrawal_type = "crypto"
-            destination_type = "wallet_address"
-            tx_hash = fake.sha256() if random.random() < 0.85 else None
-        else:
-            # Fiat withdrawal
-            currency = random.choice(SUPPORTED_FIAT)
-            amount = round(random.uniform(100.0, 50000.0), 2)
-            withdrawal_type = "fiat"
-            destination_type = random.choice(["bank_account", "card"])
-            tx_hash = None
-        
-        # Status distribution
-        status = random.choices(
-            ["completed", "pending", "failed", "rejected"],
-            weights=[0.85, 0.10, 0.03, 0.02]
-        )[0]
-        
-        # Fee (0.5% for crypto, $10 flat for fiat)
-        fee = amount * 0.005 if is_crypto else 10.0
-        
-        record = {
-            "withdrawal_id": fake.uuid4(),
-            "user_id": random.choice(user_ids),  # Use real user_id
-            "timestamp": withdrawal_date,
-            "withdrawal_type": withdrawal_type,
-            "currency": currency,
-            "amount": amount,
-            "fee": round(fee, 8) if is_crypto else fee,
-            "destination_type": destination_type,
-            "tx_hash": tx_hash,
-            "status": status,
-            "created_at": withdrawal_date
-        }
-        
-        records.append(record)
+    return _generate_in_parallel(
+        _build_withdrawals, num_withdrawals, target_date, user_ids,
+        arrow_schema=_WITHDRAWALS_ARROW_SCHEMA, rng=rng,
+        return_format=return_format, output_path=output_path
+    )
+
+
+def _build_trades(
+    rng: np.random.Generator,
+    n: int,
+    crypto_prices: Dict[str, float],
+    target_date: datetime,
+    user_ids: np.ndarray
+) -> Dict[str, object]:
+    """Builds the columns for n trades from rng (worker for generate_mock_trades)."""
+    # Timestamp generation
+    trade_date = _random_timestamps(rng, n, target_date)
+    
+    # Determine trading pair (quote can be fiat or another crypto)
+    num_crypto = len(SUPPORTED_CRYPTO)
+    base_idx = rng.integers(0, num_crypto, n)
+    
+    # Fiat quotes can never clash with a crypto base; crypto quotes are offset
+    # from the base index by 1..num_crypto-1 so base != quote without any redraws
+    quote_is_crypto = rng.random(n) < num_crypto / (len(SUPPORTED_FIAT) + num_crypto)
+    num_crypto_quotes = int(quote_is_crypto.sum())
+    quote_idx = (base_idx[quote_is_crypto] + rng.integers(1, num_crypto, num_crypto_quotes)) % num_crypto
     
-    df = pd.DataFrame(records)
-    return df
+    # Quote codes index the combined fiat+crypto pool (fiat first)
+    quote_pool_idx = rng.integers(0, len(SUPPORTED_FIAT), n)
+    quote_pool_idx[quote_is_crypto] = len(SUPPORTED_FIAT) + quote_idx
+    quote_currency = pd.Categorical.from_codes(quote_pool_idx, categories=_FIAT_AND_CRYPTO)
+    
+    # Trade amount
+    base_amount = np.round(rng.uniform(0.01, 10.0, n), 8)
+    
+    # Calculate quote amount based on prices (unknown tokens default to $1000)
+    price_table = _lookup_table(crypto_prices, SUPPORTED_CRYPTO_ARR, 1000)
+    base_price_usd = price_table[base_idx]
+    
+    # Fiat quote
+    quote_amount = np.round(base_amount * base_price_usd, 2)
+    quote_amount[quote_is_crypto] = np.round(
+        base_amount[quote_is_crypto] * base_price_usd[quote_is_crypto] / price_table[quote_idx], 8
+    )
+    
+    # Fee calculation
+    is_maker = rng.random(n) < 0.5
+    fee_rate = np.where(is_maker, 0.0025, 0.0040)
+    fee_amount = np.round(quote_amount * fee_rate, 8)
+    
+    return {
+        "trade_id": bulk_uuids(n, rng),
+        "user_id": user_ids[rng.integers(0, len(user_ids), n)],  # Use real user_id
+        "timestamp": trade_date,
+        "trading_pair": pd.Categorical.from_codes(
+            base_idx * len(_FIAT_AND_CRYPTO) + quote_pool_idx, categories=_TRADING_PAIRS
+        ),
+        "side": pd.Categorical.from_codes(rng.integers(0, 2, n), categories=["buy", "sell"]),
+        "base_currency": pd.Categorical.from_codes(base_idx, categories=SUPPORTED_CRYPTO_ARR),
+        "quote_currency": quote_currency,
+        "base_amount": base_amount,
+        "quote_amount": quote_amount,
+        "price": np.round(quote_amount / base_amount, 8),
+        "fee_amount": fee_amount,
+        "fee_currency": quote_currency,
+        "order_type": pd.Categorical.from_codes(rng.integers(0, 2, n), categories=["market", "limit"]),
+        "is_maker": is_maker,
+        "created_at": trade_date
+    }
 
 
 def generate_mock_trades(
     num_trades: int, 
     crypto_prices: Dict[str, float], 
     target_date: datetime = None,
-    user_ids: List[str] = None  # Added parameter
-) -> pd.DataFrame:
+    user_ids: List[str] = None,  # Added parameter
+    rng: Optional[np.random.Generator] = None,
+    return_format: str = "pandas",
+    output_path: str = None
+) -> Union[pd.DataFrame, pa.Table, str]:
     """
     Generates mock spot trading transactions on the exchange.
     """
-    if not user_ids:
+    if user_ids is None or len(user_ids) == 0:
         raise ValueError("user_ids must be provided to ensure referential integrity with users table")
     
-    records = []
+    # Convert once so every worker samples by integer index into one array
+    user_ids = np.asarray(user_ids, dtype=object)
     
     print(f"📈 Generating {num_trades} mock trades...")
     
-    for _ in range(num_trades):
-        # Timestamp generation
-        if target_date:
-            start_of_day = datetime.combine(target_date, datetime.min.time())
-            random_seconds = random.randint(0, 86400)
-            trade_date = start_of_day + timedelta(seconds=random_seconds)
-        else:
-            days_ago = random.randint(0, 90)
-            trade_date = datetime.now() - timedelta(days=days_ago, minutes=random.randint(0, 1440))
-        
-        # Determine trading pair
-        base_currency = random.choice(SUPPORTED_CRYPTO)
-        quote_currency = random.choice(SUPPORTED_FIAT + SUPPORTED_CRYPTO)
-        
-        # Ensure base != quote for crypto/crypto pairs
-        while base_currency == quote_currency:
-            quote_currency = random.choice(SUPPORTED_CRYPTO)
-        
-        # Trade side
-        side = random.choice(["buy", "sell"])
-        
-        # Trade amount
-        base_amount = round(random.uniform(0.01, 10.0), 8)
-        
-        # Calculate quote amount based on prices
-        base_price_usd = crypto_prices.get(base_currency, 1000)
-        if quote_currency in SUPPORTED_CRYPTO:
-            quote_price_usd = crypto_prices.get(quote_currency, 1000)
-            quote_amount = round(base_amount * base_price_usd / quote_price_usd, 8)
-        else:
-            # Fiat quote
-            quote_amount = round(base_amount * base_price_usd, 2)
-        
-        # Fee calculation
-        is_maker = random.choice([True, False])
-        fee_rate = 0.0025 if is_maker else 0.0040
-        fee_amount = round(quote_amount * fee_rate, 8)
-        
-        record = {
-            "trade_id": fake.uuid4(),
-            "user_id": random.choice(user_ids),  # Use real user_id
-            "timestamp": trade_date,
-            "trading_pair": f"{base_currency}/{quote_currency}",
-            "side": side,
-            "base_currency": base_currency,
-            "quote_currency": quote_currency,
-            "base_amount": base_amount,
-            "quote_amount": quote_amount,
-            "price": round(quote_amount / base_amount, 8),
-            "fee_amount": fee_amount,
-            "fee_currency": quote_currency,
-            "order_type": random.choice(["market", "limit"]),
-            "is_maker": is_maker,
-            "created_at": trade_date
-        }
-        
-        records.append(record)
+    return _generate_in_parallel(
+        _build_trades, num_trades, crypto_prices, target_date, user_ids,
+        arrow_schema=_TRADES_ARROW_SCHEMA, rng=rng,
+        return_format=return_format, output_path=output_path
+    )
+
+
+def _build_orders(
+    rng: np.random.Generator,
+    n: int,
+    crypto_prices: Dict[str, float],
+    target_date: datetime,
+    user_ids: np.ndarray
+) -> Dict[str, object]:
+    """Builds the columns for n orders from rng (worker for generate_mock_orders)."""
+    # Timestamp generation
+    order_date = _random_timestamps(rng, n, target_date)
+    
+    # Determine trading pair
+    base_idx = rng.integers(0, len(SUPPORTED_CRYPTO), n)
+    quote_idx = rng.integers(0, len(SUPPORTED_FIAT), n)
+    
+    # Order side and type
+    is_limit = rng.random(n) < 0.5
     
-    df = pd.DataFrame(records)
-    return df
+    # Order amount
+    base_amount = np.round(rng.uniform(0.01, 50.0, n), 8)
+    
+    # Price (limit orders are +/- 5% from market price, market orders have none)
+    price_table = _lookup_table(crypto_prices, SUPPORTED_CRYPTO_ARR, 1000)
+    base_price_usd = price_table[base_idx]
+    limit_price = np.where(
+        is_limit,
+        np.round(base_price_usd * rng.uniform(0.95, 1.05, n), 2),
+        np.nan
+    )
+    
+    # Status distribution
+    status_code = rng.choice(len(ORDER_STATUS_ARR), size=n, p=ORDER_STATUS_P)
+    
+    # Filled amount (depends on status)
+    filled_amount = np.select(
+        [status_code == _ORDER_FILLED, status_code == _ORDER_PARTIALLY_FILLED],
+        [base_amount, np.round(base_amount * rng.uniform(0.1, 0.9, n), 8)],
+        default=0.0
+    )
+    
+    return {
+        "order_id": bulk_uuids(n, rng),
+        "user_id": user_ids[rng.integers(0, len(user_ids), n)],
+        "timestamp": order_date,
+        "trading_pair": pd.Categorical.from_codes(
+            base_idx * len(_FIAT_AND_CRYPTO) + quote_idx, categories=_TRADING_PAIRS
+        ),
+        "side": pd.Categorical.from_codes(rng.integers(0, 2, n), categories=["buy", "sell"]),
+        "order_type": pd.Categorical.from_codes(is_limit.astype(np.int8), categories=["market", "limit"]),
+        "base_currency": pd.Categorical.from_codes(base_idx, categories=SUPPORTED_CRYPTO_ARR),
+        "quote_currency": pd.Categorical.from_codes(quote_idx, categories=SUPPORTED_FIAT_ARR),
+        "base_amount": base_amount,
+        "filled_amount": filled_amount,
+        "limit_price": limit_price,
+        "status": pd.Categorical.from_codes(status_code, categories=ORDER_STATUS_ARR),
+        "created_at": order_date
+    }
 
 
 def generate_mock_orders(
     num_orders: int, 
     crypto_prices: Dict[str, float], 
     target_date: datetime = None,
-    user_ids: List[str] = None
-) -> pd.DataFrame:
+    user_ids: List[str] = None,
+    rng: Optional[np.random.Generator] = None,
+    return_format: str = "pandas",
+    output_path: str = None
+) -> Union[pd.DataFrame, pa.Table, str]:
     """
     Generates mock order book entries (open, filled, cancelled orders).
     
     NOTE: Orders with status="filled" will be used to generate corresponding trades.
     """
-    if not user_ids:
+    if user_ids is None or len(user_ids) == 0:
         raise ValueError("user_ids must be provided to ensure referential integrity with users table")
     
-    records = []
+    # Convert once so every worker samples by integer index into one array
+    user_ids = np.asarray(user_ids, dtype=object)
     
     print(f"📋 Generating {num_orders} mock orders...")
     
-    for _ in range(num_orders):
-        # Timestamp generation
-        if target_date:
-            start_of_day = datetime.combine(target_date, datetime.min.time())
-            random_seconds = random.randint(0, 86400)
-            order_date = start_of_day + timedelta(seconds=random_seconds)
-        else:
-            days_ago = random.randint(0, 90)
-            order_date = datetime.now() - timedelta(days=days_ago, minutes=random.randint(0, 1440))
-        
-        # Determine trading pair
-        base_currency = random.choice(SUPPORTED_CRYPTO)
-        quote_currency = random.choice(SUPPORTED_FIAT)
-        
-        # Order side and type
-        side = random.choice(["buy", "sell"])
-        order_type = random.choice(["limit", "market"])
-        
-        # Order amount
-        base_amount = round(random.uniform(0.01, 50.0), 8)
-        
-        # Price (for limit orders, varies from market price)
-        base_price_usd = crypto_prices.get(base_currency, 1000)
-        if order_type == "limit":
-            # Limit orders are +/- 5% from market price
-            price_variation = random.uniform(0.95, 1.05)
-            limit_price = round(base_price_usd * price_variation, 2)
-        else:
-            limit_price = None
-        
-        # Status distribution
-        status = random.choices(
-            ["filled", "open", "cancelled", "partially_filled", "expired"],
-            weights=[0.40, 0.30, 0.20, 0.08, 0.02]
-        )[0]
-        
-        # Filled amount (depends on status)
-        if status == "filled":
-            filled_amount = base_amount
-        elif status == "partially_filled":
-            filled_amount = round(base_amount * random.uniform(0.1, 0.9), 8)
-        else:
-            filled_amount = 0.0
-        
-        record = {
-            "order_id": fake.uuid4(),
-            "user_id": random.choice(user_ids),
-            "timestamp": order_date,
-            "trading_pair": f"{base_currency}/{quote_currency}",
-            "side": side,
-            "order_type": order_type,
-            "base_currency": base_currency,
-            "quote_currency": quote_currency,
-            "base_amount": base_amount,
-            "filled_amount": filled_amount,
-            "limit_price": limit_price,
-            "status": status,
-            "created_at": order_date
-        }
-        
-        records.append(record)
-    
-    df = pd.DataFrame(records)
-    return df
+    return _generate_in_parallel(
+        _build_orders, num_orders, crypto_prices, target_date, user_ids,
+        arrow_schema=_ORDERS_ARROW_SCHEMA, rng=rng,
+        return_format=return_format, output_path=output_path
+    )
+
+
+# Columns of the trades produced by generate_trades_from_orders (in order)
+_TRADES_FROM_ORDERS_COLUMNS = [
+    'trade_id', 'order_id', 'user_id', 'timestamp', 'trading_pair',
+    'side', 'base_currency', 'quote_currency', 'base_amount', 'quote_amount',
+    'price', 'fee_amount', 'fee_currency', 'order_type', 'is_maker', 'created_at'
+]
 
 
-def generate_trades_from_orders(orders_df: pd.DataFrame) -> pd.DataFrame:
+def generate_trades_from_orders(
+    orders: Union[pd.DataFrame, pa.Table],
+    rng: Optional[np.random.Generator] = None
+) -> Union[pd.DataFrame, pa.Table]:
     """
     Generates trades ONLY from orders that have been filled.
     
     This ensures referential integrity: every trade references a real order.
     
+    Works on Arrow: filtering and amount arithmetic run as pyarrow compute
+    kernels, and the order columns carried over to the trades are passed
+    through as-is, without conversion. A DataFrame input is converted at the
+    boundary so both input types share one code path.
+    
     Args:
-        orders_df: DataFrame of orders (must include filled orders)
+        orders: Orders as a pyarrow.Table (e.g. straight from a BigQuery
+            to_arrow() read) or a DataFrame (must include filled orders)
+        rng: Optional NumPy Generator (pass a seeded one for reproducible data)
     
     Returns:
-        pd.DataFrame: Trades generated from filled orders
+        Trades generated from filled orders, as a pyarrow.Table for an Arrow
+        input or a pd.DataFrame for a DataFrame input
     """
+    as_pandas = isinstance(orders, pd.DataFrame)
+    if as_pandas:
+        orders = pa.Table.from_pandas(orders, preserve_index=False)
+    
     # Filter for filled and partially_filled orders only
-    filled_orders = orders_df[orders_df['status'].isin(['filled', 'partially_filled'])].copy()
+    is_filled = pc.is_in(orders['status'], value_set=pa.array(['filled', 'partially_filled']))
+    filled_orders = orders.filter(is_filled)
     
-    if len(filled_orders) == 0:
+    if filled_orders.num_rows == 0:
         print("⚠️ No filled orders found to generate trades from")
-        return pd.DataFrame(columns=[
-            'trade_id', 'order_id', 'user_id', 'timestamp', 'trading_pair',
-            'side', 'base_currency', 'quote_currency', 'base_amount', 'quote_amount',
-            'price', 'fee_amount', 'fee_currency', 'order_type', 'is_maker', 'created_at'
-        ])
+        if as_pandas:
+            return pd.DataFrame(columns=_TRADES_FROM_ORDERS_COLUMNS)
+        return _TRADES_ARROW_SCHEMA.insert(1, pa.field('order_id', pa.string())).empty_table()
     
-    print(f"📈 Generating {len(filled_orders)} trades from filled orders...")
+    print(f"📈 Generating {filled_orders.num_rows} trades from filled orders...")
     
-    trades = []
+    if rng is None:
+        rng = np.random.default_rng()
+    n = filled_orders.num_rows
     
-    for _, order in filled_orders.iterrows():
-        # Use the filled_amount from the order
-        base_amount = order['filled_amount']
-        
-        # Calculate quote amount based on order price or limit price
-        if order['limit_price'] is not None:
-            price = order['limit_price']
-        else:
-            # Market order - use a reasonable market price (would come from order book in reality)
-            # For simulation, we'll use a price based on typical market rates
-            price = round(random.uniform(1000, 100000), 2)  # Simplified
-        
-        quote_amount = round(base_amount * price, 8)
-        
-        # Fee calculation
-        is_maker = random.choice([True, False])
-        fee_rate = 0.0025 if is_maker else 0.0040
-        fee_amount = round(quote_amount * fee_rate, 8)
-        
-        trade = {
-            "trade_id": fake.uuid4(),
-            "order_id": order['order_id'],  # CRITICAL: Links trade to order
-            "user_id": order['user_id'],
-            "timestamp": order['timestamp'],
-            "trading_pair": order['trading_pair'],
-            "side": order['side'],
-            "base_currency": order['base_currency'],
-            "quote_currency": order['quote_currency'],
-            "base_amount": base_amount,
-            "quote_amount": quote_amount,
-            "price": price,
-            "fee_amount": fee_amount,
-            "fee_currency": order['quote_currency'],
-            "order_type": order['order_type'],
-            "is_maker": is_maker,
-            "created_at": order['created_at']
-        }
-        
-        trades.append(trade)
+    # Use the filled_amount from the order
+    base_amount = filled_orders['filled_amount']
+    
+    # Calculate quote amount based on order price or limit price
+    # Market orders have no limit price (null) - use a reasonable market price
+    # (would come from order book in reality; simplified for simulation)
+    limit_price = filled_orders['limit_price']
+    market_price = np.round(rng.uniform(1000, 100000, n), 2)
+    price = pc.if_else(pc.is_null(limit_price, nan_is_null=True), market_price, limit_price)
+    
+    quote_amount = pc.round(pc.multiply(base_amount, price), 8)
+    
+    # Fee calculation
+    is_maker = rng.random(n) < 0.5
+    fee_rate = np.where(is_maker, 0.0025, 0.0040)
+    fee_amount = pc.round(pc.multiply(quote_amount, pa.array(fee_rate)), 8)
+    
+    trades = pa.table({
+        "trade_id": bulk_uuids(n, rng),
+        "order_id": filled_orders['order_id'],  # CRITICAL: Links trade to order
+        "user_id": filled_orders['user_id'],
+        "timestamp": filled_orders['timestamp'],
+        "trading_pair": filled_orders['trading_pair'],
+        "side": filled_orders['side'],
+        "base_currency": filled_orders['base_currency'],
+        "quote_currency": filled_orders['quote_currency'],
+        "base_amount": base_amount,
+        "quote_amount": quote_amount,
+        "price": price,
+        "fee_amount": fee_amount,
+        "fee_currency": filled_orders['quote_currency'],
+        "order_type": filled_orders['order_type'],
+        "is_maker": is_maker,
+        "created_at": filled_orders['created_at']
+    })
     
-    return pd.DataFrame(trades)
+    return trades.to_pandas() if as_pandas else trades
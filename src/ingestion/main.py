@@ -3,15 +3,21 @@ Main entry point for the data ingestion pipeline.
 Orchestrates fetching live data and generating mock transactions.
 """
 
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 from pathlib import Path
 from datetime import datetime
+from typing import Union
 from .config import (
-    RAW_DATA_DIR, DAILY_BATCH_SIZE, BQ_TABLE_FULL, NUM_USERS, BQ_USERS_TABLE_FULL, 
+    RAW_DATA_DIR, LOG_LEVEL, WRITE_CSV_BACKUP, ensure_dirs, DAILY_BATCH_SIZE, BQ_TABLE_FULL, NUM_USERS, BQ_USERS_TABLE_FULL, 
     NUM_DEPOSITS, BQ_DEPOSITS_TABLE_FULL, NUM_WITHDRAWALS, BQ_WITHDRAWALS_TABLE_FULL,
     NUM_TRADES, BQ_TRADES_TABLE_FULL, NUM_ORDERS, BQ_ORDERS_TABLE_FULL
 )
-from .apis import fetch_crypto_prices, fetch_exchange_rates
+from .apis import fetch_crypto_prices, fetch_market_data
 from .generators import (
     generate_mock_ramp_data, generate_mock_users, generate_mock_deposits,
     generate_mock_withdrawals, generate_mock_trades, generate_mock_orders,
@@ -27,10 +33,43 @@ from .bigquery_loader import (
     create_withdrawals_table_if_not_exists,
     create_trades_table_if_not_exists,
     create_orders_table_if_not_exists,
-    get_user_ids_from_bigquery  # Import new function
+    ensure_all_tables,
+    get_bqstorage_client,
+    get_user_ids_from_bigquery,  # Import new function
+    clear_user_ids_cache
 )
 from .state_manager import get_next_batch_date, save_last_run_date
 
+# Single logging setup for the whole pipeline; library modules only create
+# their own loggers. Plain message format keeps the console output readable.
+logging.basicConfig(level=LOG_LEVEL, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+
+def _write_csv(df: Union[pd.DataFrame, pa.Table], output_path: Path) -> None:
+    """Writes df to output_path with Arrow's multi-threaded C++ CSV writer."""
+    table = df if isinstance(df, pa.Table) else pa.Table.from_pandas(df, preserve_index=False)
+    pacsv.write_csv(table, str(output_path))
+    print(f"💾 Backup saved to: {output_path}")
+
+
+def save_csv_backup(df: Union[pd.DataFrame, pa.Table], output_path: Path) -> None:
+    """
+    Writes a local CSV backup of a loaded table, if WRITE_CSV_BACKUP is set.
+    
+    The BigQuery load is authoritative, so the backup is written in a
+    background thread and the caller returns right away. The thread is not a
+    daemon, so the interpreter still waits for the file to be complete.
+    
+    Args:
+        df: DataFrame or Arrow table to back up (must not be modified afterwards)
+        output_path: Destination CSV file
+    """
+    if not WRITE_CSV_BACKUP:
+        return
+    
+    threading.Thread(target=_write_csv, args=(df, output_path), name="csv-backup").start()
+
 
 def run_ingestion():
     """
@@ -39,7 +78,7 @@ def run_ingestion():
     Pipeline Steps:
         1. Determine next batch date to process
         2. Fetch live cryptocurrency prices from CoinGecko
-        3. Fetch live foreign exchange rates
+        3. Fetch live foreign exchange rates (concurrently with step 2)
         4. Generate realistic mock transaction data for that date
         5. Load data to BigQuery
         6. Save state metadata for next run
@@ -51,6 +90,9 @@ def run_ingestion():
     """
     print("🚀 Starting Ramp Data Ingestion (BigQuery + Incremental)...")
     
+    # Local data directories (CSV backups, run metadata) are created on demand
+    ensure_dirs()
+    
     # ========================================================================
     # STEP 1: Determine Next Batch Date
     # ========================================================================
@@ -83,11 +125,9 @@ def run_ingestion():
     # ========================================================================
     # STEP 3: Fetch External Market Data
     # ========================================================================
-    # Get current crypto prices in USD (e.g., BTC = $65,000)
-    crypto_prices = fetch_crypto_prices()
-    
-    # Get foreign exchange rates relative to USD (e.g., 1 EUR = 0.92 USD)
-    fx_rates = fetch_exchange_rates()
+    # Get current crypto prices in USD (e.g., BTC = $65,000) and foreign
+    # exchange rates relative to USD (e.g., 1 EUR = 0.92 USD) in parallel
+    crypto_prices, fx_rates = fetch_market_data()
     
     # ========================================================================
     # STEP 4: Generate Mock Transaction Data for Specific Date
@@ -104,17 +144,17 @@ def run_ingestion():
     # ========================================================================
     # STEP 5: Load to BigQuery
     # ========================================================================
+    # Overwrites the batch date's partition, so re-running a day is idempotent
     print(f"📤 Loading {len(df)} rows to BigQuery...")
-    rows_loaded = load_dataframe_to_bigquery(client, df)
+    rows_loaded = load_dataframe_to_bigquery(client, df, partition_date=batch_date)
     print(f"✅ Successfully loaded {rows_loaded} rows to {BQ_TABLE_FULL}")
     
     # ========================================================================
     # STEP 6: Save CSV Backup (Optional)
     # ========================================================================
-    # Save to local CSV for backup/debugging
+    # Save to local CSV for backup/debugging (WRITE_CSV_BACKUP=1, in the background)
     output_path = RAW_DATA_DIR / f"ramp_transactions_{batch_date}.csv"
-    df.to_csv(output_path, index=False)
-    print(f"💾 Backup saved to: {output_path}")
+    save_csv_backup(df, output_path)
     
     # ========================================================================
     # STEP 7: Update State Metadata
@@ -124,19 +164,26 @@ def run_ingestion():
     # ========================================================================
     # STEP 8: Log Results
     # ========================================================================
-    print(f"📊 Sample Data:\n{df.head(3)}")  # Show first 3 rows
+    # Show first 3 rows (DEBUG only: the table repr is only built when logged)
+    logger.debug("📊 Sample Data:\n%s", df.head(3))
     print("✅ Ingestion Complete.")
     print(f"\n💡 Run again to process next day's data!")
 
 
-def load_users_table():
+def load_users_table(client=None):
     """
     One-time operation to populate the users table.
     Run this before generating transactions to ensure user_ids exist.
+    
+    Args:
+        client: BigQuery client to reuse (defaults to the shared process client)
     """
     print("👥 Starting Users Table Population...")
     
-    client = get_bigquery_client()
+    ensure_dirs()
+    
+    if client is None:
+        client = get_bigquery_client()
     print(f"✅ Connected to BigQuery project")
     
     # Create users table if it doesn't exist
@@ -150,22 +197,30 @@ def load_users_table():
     rows_loaded = load_dataframe_to_table(client, users_df, BQ_USERS_TABLE_FULL)
     print(f"✅ Successfully loaded {rows_loaded} rows to {BQ_USERS_TABLE_FULL}")
     
-    # Save backup CSV
+    # New users invalidate any user_ids cached earlier in this process
+    clear_user_ids_cache()
+    
+    # Save backup CSV (if enabled, in the background)
     output_path = RAW_DATA_DIR / "users.csv"
-    users_df.to_csv(output_path, index=False)
-    print(f"💾 Backup saved to: {output_path}")
+    save_csv_backup(users_df, output_path)
     
-    print(f"📊 Sample Data:\n{users_df.head(3)}")
+    logger.debug("📊 Sample Data:\n%s", users_df.head(3))
     print("✅ Users table population complete!")
 
 
-def load_deposits_table():
+def load_deposits_table(client=None):
     """
     One-time operation to populate the deposits table.
+    
+    Args:
+        client: BigQuery client to reuse (defaults to the shared process client)
     """
     print("💰 Starting Deposits Table Population...")
     
-    client = get_bigquery_client()
+    ensure_dirs()
+    
+    if client is None:
+        client = get_bigquery_client()
     print(f"✅ Connected to BigQuery project")
     
     user_ids = get_user_ids_from_bigquery(client)
@@ -184,20 +239,27 @@ def load_deposits_table():
     rows_loaded = load_dataframe_to_table(client, deposits_df, BQ_DEPOSITS_TABLE_FULL)
     print(f"✅ Successfully loaded {rows_loaded} rows to {BQ_DEPOSITS_TABLE_FULL}")
     
-    # Save backup CSV
+    # Save backup CSV (if enabled, in the background)
     output_path = RAW_DATA_DIR / "deposits.csv"
-    deposits_df.to_csv(output_path, index=False)
-    print(f"💾 Backup saved to: {output_path}")
+    save_csv_backup(deposits_df, output_path)
     
-    print(f"📊 Sample Data:\n{deposits_df.head(3)}")
+    logger.debug("📊 Sample Data:\n%s", deposits_df.head(3))
     print("✅ Deposits table population complete!")
 
 
-def load_withdrawals_table():
-    """One-time operation to populate the withdrawals table."""
+def load_withdrawals_table(client=None):
+    """
+    One-time operation to populate the withdrawals table.
+    
+    Args:
+        client: BigQuery client to reuse (defaults to the shared process client)
+    """
     print("💸 Starting Withdrawals Table Population...")
     
-    client = get_bigquery_client()
+    ensure_dirs()
+    
+    if client is None:
+        client = get_bigquery_client()
     
     user_ids = get_user_ids_from_bigquery(client)
     if not user_ids:
@@ -213,20 +275,27 @@ def load_withdrawals_table():
     rows_loaded = load_dataframe_to_table(client, withdrawals_df, BQ_WITHDRAWALS_TABLE_FULL)
     print(f"✅ Successfully loaded {rows_loaded} rows to {BQ_WITHDRAWALS_TABLE_FULL}")
     
-    # Save backup CSV
+    # Save backup CSV (if enabled, in the background)
     output_path = RAW_DATA_DIR / "withdrawals.csv"
-    withdrawals_df.to_csv(output_path, index=False)
-    print(f"💾 Backup saved to: {output_path}")
+    save_csv_backup(withdrawals_df, output_path)
     
-    print(f"📊 Sample Data:\n{withdrawals_df.head(3)}")
+    logger.debug("📊 Sample Data:\n%s", withdrawals_df.head(3))
     print("✅ Withdrawals table population complete!")
 
 
-def load_orders_table():
-    """One-time operation to populate the orders table."""
+def load_orders_table(client=None):
+    """
+    One-time operation to populate the orders table.
+    
+    Args:
+        client: BigQuery client to reuse (defaults to the shared process client)
+    """
     print("📋 Starting Orders Table Population...")
     
-    client = get_bigquery_client()
+    ensure_dirs()
+    
+    if client is None:
+        client = get_bigquery_client()
     
     user_ids = get_user_ids_from_bigquery(client)
     if not user_ids:
@@ -244,58 +313,66 @@ def load_orders_table():
     rows_loaded = load_dataframe_to_table(client, orders_df, BQ_ORDERS_TABLE_FULL)
     print(f"✅ Successfully loaded {rows_loaded} rows to {BQ_ORDERS_TABLE_FULL}")
     
-    # Save backup CSV
+    # Save backup CSV (if enabled, in the background)
     output_path = RAW_DATA_DIR / "orders.csv"
-    orders_df.to_csv(output_path, index=False)
-    print(f"💾 Backup saved to: {output_path}")
+    save_csv_backup(orders_df, output_path)
     
-    print(f"📊 Sample Data:\n{orders_df.head(3)}")
+    logger.debug("📊 Sample Data:\n%s", orders_df.head(3))
     print("✅ Orders table population complete!")
 
 
-def load_trades_from_orders():
+def load_trades_from_orders(client=None):
     """
     Generates and loads trades based on filled orders in BigQuery.
     This ensures every trade has a corresponding order.
+    
+    Args:
+        client: BigQuery client to reuse (defaults to the shared process client)
     """
     print("📈 Starting Trades Table Population from Orders...")
     
-    client = get_bigquery_client()
+    ensure_dirs()
+    
+    if client is None:
+        client = get_bigquery_client()
     
     # Create trades table if it doesn't exist
     create_trades_table_if_not_exists(client)
     
-    # Query filled orders from BigQuery
+    # Query filled orders from BigQuery (only the columns trades are built from)
     query = f"""
-        SELECT *
+        SELECT order_id, user_id, timestamp, trading_pair, side, order_type,
+               base_currency, quote_currency, filled_amount, limit_price,
+               status, created_at
         FROM `{BQ_ORDERS_TABLE_FULL}`
         WHERE status IN ('filled', 'partially_filled')
     """
     
+    # Read the result as Arrow (through the Storage API when available) and
+    # keep the trades in Arrow all the way to the Parquet load job
     print("📥 Fetching filled orders from BigQuery...")
-    orders_df = client.query(query).to_dataframe()
+    orders_table = client.query(query).result().to_arrow(bqstorage_client=get_bqstorage_client())
     
-    if len(orders_df) == 0:
+    if orders_table.num_rows == 0:
         print("⚠️ No filled orders found. Cannot generate trades.")
         print("💡 Make sure orders table has some 'filled' status orders.")
         return
     
-    print(f"✅ Found {len(orders_df)} filled orders")
+    print(f"✅ Found {orders_table.num_rows} filled orders")
     
     # Generate trades from these orders
-    trades_df = generate_trades_from_orders(orders_df)
+    trades_table = generate_trades_from_orders(orders_table)
     
     # Load to BigQuery
-    print(f"📤 Loading {len(trades_df)} trades to BigQuery...")
-    rows_loaded = load_dataframe_to_table(client, trades_df, BQ_TRADES_TABLE_FULL)
+    print(f"📤 Loading {trades_table.num_rows} trades to BigQuery...")
+    rows_loaded = load_dataframe_to_table(client, trades_table, BQ_TRADES_TABLE_FULL)
     print(f"✅ Successfully loaded {rows_loaded} rows to {BQ_TRADES_TABLE_FULL}")
     
-    # Save backup CSV
+    # Save backup CSV (if enabled, in the background)
     output_path = RAW_DATA_DIR / "trades.csv"
-    trades_df.to_csv(output_path, index=False)
-    print(f"💾 Backup saved to: {output_path}")
+    save_csv_backup(trades_table, output_path)
     
-    print(f"📊 Sample Data:\n{trades_df.head(3)}")
+    logger.debug("📊 Sample Data:\n%s", trades_table.slice(0, 3))
     print("✅ Trades table population complete!")
 
 
@@ -306,24 +383,36 @@ def load_all_tables():
     """
     print("🚀 Loading All Exchange Tables (with proper referential integrity)...\n")
     
-    print("Step 1/5: Loading Users (foundational table)...")
-    load_users_table()
+    # One client for every step (credentials and HTTP connection pool shared)
+    client = get_bigquery_client()
     
-    print("\n" + "="*60 + "\n")
-    print("Step 2/5: Loading Deposits...")
-    load_deposits_table()
+    # Create all missing tables up front (one list call + parallel creates);
+    # the per-table create_*_if_not_exists calls below then become no-ops
+    ensure_all_tables(client)
     
-    print("\n" + "="*60 + "\n")
-    print("Step 3/5: Loading Withdrawals...")
-    load_withdrawals_table()
+    print("Step 1/5: Loading Users (foundational table)...")
+    load_users_table(client)
+    
+    # Deposits, withdrawals and orders only depend on users, so their
+    # generate + load jobs run concurrently (each thread mostly waits on
+    # BigQuery). Reading user_ids once here warms the cache the three
+    # loaders share, so they don't each query the users table.
+    get_user_ids_from_bigquery(client)
     
     print("\n" + "="*60 + "\n")
-    print("Step 4/5: Loading Orders...")
-    load_orders_table()
+    print("Steps 2-4/5: Loading Deposits, Withdrawals and Orders in parallel...")
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(load_deposits_table, client),
+            executor.submit(load_withdrawals_table, client),
+            executor.submit(load_orders_table, client),
+        ]
+        for future in futures:
+            future.result()
     
     print("\n" + "="*60 + "\n")
     print("Step 5/5: Loading Trades (generated FROM filled orders)...")
-    load_trades_from_orders()
+    load_trades_from_orders(client)
     
     print("\n" + "="*60 + "\n")
     print("🎉 All tables loaded successfully!")
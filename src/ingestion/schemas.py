@@ -0,0 +1,137 @@
+"""
+BigQuery table schemas for all raw exchange tables.
+Single registry used for table creation and load jobs, plus the
+partitioning and clustering layout of each table.
+"""
+
+from google.cloud import bigquery
+from .config import (
+    BQ_TABLE, BQ_USERS_TABLE, BQ_DEPOSITS_TABLE, BQ_WITHDRAWALS_TABLE,
+    BQ_TRADES_TABLE, BQ_ORDERS_TABLE
+)
+
+# Schemas are immutable tuples built once at import time and shared by
+# every create/load call
+
+# ramp_transactions table
+TRANSACTIONS_SCHEMA = (
+    bigquery.SchemaField("transaction_id", "STRING", mode="REQUIRED", description="Unique transaction identifier"),
+    bigquery.SchemaField("user_id", "STRING", mode="REQUIRED", description="User identifier"),
+    bigquery.SchemaField("timestamp", "TIMESTAMP", mode="REQUIRED", description="Transaction timestamp"),
+    bigquery.SchemaField("fiat_currency", "STRING", mode="REQUIRED", description="Fiat currency code (USD, EUR, etc.)"),
+    bigquery.SchemaField("fiat_amount", "FLOAT64", mode="REQUIRED", description="Amount in fiat currency"),
+    bigquery.SchemaField("crypto_token", "STRING", mode="REQUIRED", description="Cryptocurrency purchased"),
+    bigquery.SchemaField("crypto_amount", "FLOAT64", mode="REQUIRED", description="Amount of crypto received"),
+    bigquery.SchemaField("payment_method", "STRING", mode="REQUIRED", description="Payment method used"),
+    bigquery.SchemaField("country", "STRING", mode="REQUIRED", description="User country code"),
+    bigquery.SchemaField("status", "STRING", mode="REQUIRED", description="Transaction status"),
+    bigquery.SchemaField("fee_usd", "FLOAT64", mode="REQUIRED", description="Transaction fee in USD"),
+)
+
+# users table
+USERS_SCHEMA = (
+    bigquery.SchemaField("user_id", "STRING", mode="REQUIRED", description="Unique user identifier"),
+    bigquery.SchemaField("email", "STRING", mode="REQUIRED", description="User email address"),
+    bigquery.SchemaField("signup_date", "TIMESTAMP", mode="REQUIRED", description="Account creation date"),
+    bigquery.SchemaField("country", "STRING", mode="REQUIRED", description="User country code"),
+    bigquery.SchemaField("kyc_status", "STRING", mode="REQUIRED", description="KYC verification status"),
+    bigquery.SchemaField("account_tier", "STRING", mode="REQUIRED", description="Account tier level"),
+    bigquery.SchemaField("account_balance_usd", "FLOAT64", mode="REQUIRED", description="Current balance in USD"),
+    bigquery.SchemaField("is_active", "BOOLEAN", mode="REQUIRED", description="Account active status"),
+    bigquery.SchemaField("created_at", "TIMESTAMP", mode="REQUIRED", description="Record creation timestamp"),
+)
+
+# deposits table
+DEPOSITS_SCHEMA = (
+    bigquery.SchemaField("deposit_id", "STRING", mode="REQUIRED", description="Unique deposit identifier"),
+    bigquery.SchemaField("user_id", "STRING", mode="REQUIRED", description="User identifier"),
+    bigquery.SchemaField("timestamp", "TIMESTAMP", mode="REQUIRED", description="Deposit initiation time"),
+    bigquery.SchemaField("deposit_type", "STRING", mode="REQUIRED", description="Type of deposit (fiat or crypto)"),
+    bigquery.SchemaField("currency", "STRING", mode="REQUIRED", description="Currency code"),
+    bigquery.SchemaField("amount", "FLOAT64", mode="REQUIRED", description="Deposit amount"),
+    bigquery.SchemaField("payment_method", "STRING", mode="REQUIRED", description="Payment method used"),
+    bigquery.SchemaField("status", "STRING", mode="REQUIRED", description="Deposit status"),
+    bigquery.SchemaField("blockchain_confirmations", "INT64", mode="NULLABLE", description="Blockchain confirmations (crypto only)"),
+    bigquery.SchemaField("created_at", "TIMESTAMP", mode="REQUIRED", description="Record creation timestamp"),
+)
+
+# withdrawals table
+WITHDRAWALS_SCHEMA = (
+    bigquery.SchemaField("withdrawal_id", "STRING", mode="REQUIRED", description="Unique withdrawal identifier"),
+    bigquery.SchemaField("user_id", "STRING", mode="REQUIRED", description="User identifier"),
+    bigquery.SchemaField("timestamp", "TIMESTAMP", mode="REQUIRED", description="Withdrawal initiation time"),
+    bigquery.SchemaField("withdrawal_type", "STRING", mode="REQUIRED", description="Type of withdrawal (fiat or crypto)"),
+    bigquery.SchemaField("currency", "STRING", mode="REQUIRED", description="Currency code"),
+    bigquery.SchemaField("amount", "FLOAT64", mode="REQUIRED", description="Withdrawal amount"),
+    bigquery.SchemaField("fee", "FLOAT64", mode="REQUIRED", description="Withdrawal fee"),
+    bigquery.SchemaField("destination_type", "STRING", mode="REQUIRED", description="Destination type"),
+    bigquery.SchemaField("tx_hash", "STRING", mode="NULLABLE", description="Blockchain transaction hash"),
+    bigquery.SchemaField("status", "STRING", mode="REQUIRED", description="Withdrawal status"),
+    bigquery.SchemaField("created_at", "TIMESTAMP", mode="REQUIRED", description="Record creation timestamp"),
+)
+
+# trades table
+TRADES_SCHEMA = (
+    bigquery.SchemaField("trade_id", "STRING", mode="REQUIRED", description="Unique trade identifier"),
+    bigquery.SchemaField("order_id", "STRING", mode="REQUIRED", description="Order that generated this trade"),
+    bigquery.SchemaField("user_id", "STRING", mode="REQUIRED", description="User identifier"),
+    bigquery.SchemaField("timestamp", "TIMESTAMP", mode="REQUIRED", description="Trade execution time"),
+    bigquery.SchemaField("trading_pair", "STRING", mode="REQUIRED", description="Trading pair (e.g. BTC/USD)"),
+    bigquery.SchemaField("side", "STRING", mode="REQUIRED", description="Trade side (buy or sell)"),
+    bigquery.SchemaField("base_currency", "STRING", mode="REQUIRED", description="Base currency"),
+    bigquery.SchemaField("quote_currency", "STRING", mode="REQUIRED", description="Quote currency"),
+    bigquery.SchemaField("base_amount", "FLOAT64", mode="REQUIRED", description="Amount in base currency"),
+    bigquery.SchemaField("quote_amount", "FLOAT64", mode="REQUIRED", description="Amount in quote currency"),
+    bigquery.SchemaField("price", "FLOAT64", mode="REQUIRED", description="Execution price"),
+    bigquery.SchemaField("fee_amount", "FLOAT64", mode="REQUIRED", description="Trading fee amount"),
+    bigquery.SchemaField("fee_currency", "STRING", mode="REQUIRED", description="Fee currency"),
+    bigquery.SchemaField("order_type", "STRING", mode="REQUIRED", description="Order type (market or limit)"),
+    bigquery.SchemaField("is_maker", "BOOLEAN", mode="REQUIRED", description="Whether this was a maker order"),
+    bigquery.SchemaField("created_at", "TIMESTAMP", mode="REQUIRED", description="Record creation timestamp"),
+)
+
+# orders table
+ORDERS_SCHEMA = (
+    bigquery.SchemaField("order_id", "STRING", mode="REQUIRED", description="Unique order identifier"),
+    bigquery.SchemaField("user_id", "STRING", mode="REQUIRED", description="User identifier"),
+    bigquery.SchemaField("timestamp", "TIMESTAMP", mode="REQUIRED", description="Order placement time"),
+    bigquery.SchemaField("trading_pair", "STRING", mode="REQUIRED", description="Trading pair (e.g. BTC/USD)"),
+    bigquery.SchemaField("side", "STRING", mode="REQUIRED", description="Order side (buy or sell)"),
+    bigquery.SchemaField("order_type", "STRING", mode="REQUIRED", description="Order type (market or limit)"),
+    bigquery.SchemaField("base_currency", "STRING", mode="REQUIRED", description="Base currency"),
+    bigquery.SchemaField("quote_currency", "STRING", mode="REQUIRED", description="Quote currency"),
+    bigquery.SchemaField("base_amount", "FLOAT64", mode="REQUIRED", description="Total order amount"),
+    bigquery.SchemaField("filled_amount", "FLOAT64", mode="REQUIRED", description="Amount filled"),
+    bigquery.SchemaField("limit_price", "FLOAT64", mode="NULLABLE", description="Limit price (for limit orders)"),
+    bigquery.SchemaField("status", "STRING", mode="REQUIRED", description="Order status"),
+    bigquery.SchemaField("created_at", "TIMESTAMP", mode="REQUIRED", description="Record creation timestamp"),
+)
+
+# Table name → schema, one entry per raw table
+SCHEMAS = {
+    BQ_TABLE: TRANSACTIONS_SCHEMA,
+    BQ_USERS_TABLE: USERS_SCHEMA,
+    BQ_DEPOSITS_TABLE: DEPOSITS_SCHEMA,
+    BQ_WITHDRAWALS_TABLE: WITHDRAWALS_SCHEMA,
+    BQ_TRADES_TABLE: TRADES_SCHEMA,
+    BQ_ORDERS_TABLE: ORDERS_SCHEMA,
+}
+
+# Day-partitioning column per table. Tables not listed are unpartitioned.
+# Lets queries filtered on time prune to the partitions they touch.
+PARTITION_FIELDS = {
+    BQ_TABLE: "timestamp",
+    BQ_DEPOSITS_TABLE: "timestamp",
+    BQ_WITHDRAWALS_TABLE: "timestamp",
+    BQ_TRADES_TABLE: "timestamp",
+    BQ_ORDERS_TABLE: "timestamp",
+}
+
+# Clustering columns per table (most selective join/filter keys first)
+CLUSTERING_FIELDS = {
+    BQ_TABLE: ["user_id", "fiat_currency"],
+    BQ_DEPOSITS_TABLE: ["user_id", "currency"],
+    BQ_WITHDRAWALS_TABLE: ["user_id", "currency"],
+    BQ_TRADES_TABLE: ["user_id", "trading_pair"],
+    BQ_ORDERS_TABLE: ["user_id", "trading_pair"],
+}
@@ -4,10 +4,15 @@ Tracks which dates have been processed to enable idempotent pipeline runs.
 """
 
 import json
+import os
 from datetime import datetime, timedelta
 from pathlib import Path
 from .config import LAST_RUN_FILE
 
+# Last processed date known to this process (set on first read and on every
+# save), so repeated lookups don't re-read and re-parse the metadata file
+_LAST_RUN_CACHE = None
+
 
 def get_last_run_date():
     """
@@ -16,6 +21,10 @@ def get_last_run_date():
     Returns:
         datetime.date: Last processed date, or None if never run
     """
+    global _LAST_RUN_CACHE
+    if _LAST_RUN_CACHE is not None:
+        return _LAST_RUN_CACHE
+    
     # Check if metadata file exists
     if not LAST_RUN_FILE.exists():
         return None
@@ -27,7 +36,8 @@ def get_last_run_date():
     # Parse ISO date string back to date object
     last_date_str = metadata.get('last_run_date')
     if last_date_str:
-        return datetime.fromisoformat(last_date_str).date()
+        _LAST_RUN_CACHE = datetime.fromisoformat(last_date_str).date()
+        return _LAST_RUN_CACHE
     
     return None
 
@@ -36,18 +46,28 @@ def save_last_run_date(run_date):
     """
     Save the successfully processed date to metadata file.
     
+    The file is written atomically (temp file + os.replace), so a crash
+    mid-write leaves the previous state intact instead of corrupt JSON.
+    
     Args:
         run_date (datetime.date): Date that was just processed
     """
+    global _LAST_RUN_CACHE
+    
     # Create metadata dictionary
     metadata = {
         'last_run_date': run_date.isoformat(),
         'last_run_timestamp': datetime.now().isoformat(),
     }
     
-    # Write to JSON file
-    with open(LAST_RUN_FILE, 'w') as f:
+    # Write to a temp file next to it, then swap it in
+    tmp_file = LAST_RUN_FILE.with_suffix('.tmp')
+    with open(tmp_file, 'w') as f:
         json.dump(metadata, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, LAST_RUN_FILE)
+    _LAST_RUN_CACHE = run_date
     
     print(f"📝 Saved metadata: Last run date = {run_date}")
 
@@ -0,0 +1,60 @@
+"""
+Tests for the last-transaction-date lookup in bigquery_loader.
+
+The BigQuery client is mocked: each client.query() call returns the next
+canned Arrow result, and the SQL text of every call is recorded.
+"""
+
+import unittest
+from datetime import date
+from unittest import mock
+
+import pyarrow as pa
+
+from src.ingestion import bigquery_loader
+
+
+def _mock_client(*results: pa.Table) -> mock.MagicMock:
+    """Client whose successive query() calls return the given Arrow tables."""
+    client = mock.MagicMock()
+    jobs = []
+    for result in results:
+        job = mock.MagicMock()
+        job.result.return_value.to_arrow.return_value = result
+        jobs.append(job)
+    client.query.side_effect = jobs
+    return client
+
+
+class QueryLastTransactionDateTest(unittest.TestCase):
+
+    def setUp(self):
+        # Storage API client is irrelevant here (and needs credentials)
+        patcher = mock.patch.object(bigquery_loader, "get_bqstorage_client", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_streaming_partition_id_falls_back_to_table_query(self):
+        client = _mock_client(
+            pa.table({"last_partition": ["__STREAMING_UNPARTITIONED__"]}),
+            pa.table({"last_date": [date(2024, 3, 5)]}),
+        )
+
+        self.assertEqual(bigquery_loader.query_last_transaction_date(client), "2024-03-05")
+
+        self.assertEqual(client.query.call_count, 2)
+        fallback_sql = client.query.call_args_list[1][0][0]
+        self.assertIn("TIMESTAMP_SUB", fallback_sql)
+
+    def test_partition_metadata_query_only_counts_day_partitions(self):
+        client = _mock_client(pa.table({"last_partition": ["20240305"]}))
+
+        self.assertEqual(bigquery_loader.query_last_transaction_date(client), "2024-03-05")
+
+        metadata_sql = client.query.call_args[0][0]
+        self.assertIn(r"REGEXP_CONTAINS(partition_id, r'^\d{8}$')", metadata_sql)
+        self.assertNotIn("__UNPARTITIONED__", metadata_sql)
+
+
+if __name__ == "__main__":
+    unittest.main()